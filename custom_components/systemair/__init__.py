@@ -2,7 +2,22 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
-from .const import DOMAIN
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from .const import (
+    DOMAIN,
+    CONF_HUB_NAME,
+    CONF_TRANSPORT,
+    TRANSPORT_HUB,
+    CONF_PROXY_PORT,
+    CONF_PROXY_MAX_AGE,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_PROXY_MAX_AGE,
+)
+from .coordinator import SystemairCoordinator, unsupported_store
+from .proxy import async_attach_proxy, async_detach_proxy
+from .services import async_cancel_capture, async_setup_services
+from .transport import async_acquire_client, async_release_client
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,22 +30,68 @@ PLATFORMS = [
     Platform.SWITCH,
     Platform.SELECT,
     Platform.TIME,
+    Platform.CALENDAR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config) -> bool:
+    """Register the services shared by all units."""
+    async_setup_services(hass)
+    return True
+
+async def _async_get_hub(hass: HomeAssistant, entry: ConfigEntry):
+    """Return the object the platforms call async_pb_call on."""
+    config = entry.data
+    if config.get(CONF_TRANSPORT, TRANSPORT_HUB) != TRANSPORT_HUB:
+        return await async_acquire_client(hass, config)
+
+    from homeassistant.components.modbus import get_hub
+    hub_name = config.get(CONF_HUB_NAME, "modbus_hub")
+    try:
+        hub = get_hub(hass, hub_name)
+    except KeyError:
+        hub = None
+    if hub is None:
+        raise ConfigEntryNotReady(f"Modbus hub '{hub_name}' not found")
+    return hub
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SaveVSR from a config entry."""
-    # We don't need to manually store entry.data in hass.data anymore 
-    # because the platform files access it via 'entry.data'
     hass.data.setdefault(DOMAIN, {})
+    hub = await _async_get_hub(hass, entry)
+    # Platforms pick the coordinator up from here
+    coordinator = SystemairCoordinator(hass, entry, hub)
+    await coordinator.async_load_unsupported()
+    hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # First read once the entities have told the coordinator what they need
+    await coordinator.async_refresh()
+    options = {**entry.data, **entry.options}
+    if port := options.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT):
+        await async_attach_proxy(hass, port, coordinator, options.get(CONF_PROXY_MAX_AGE, DEFAULT_PROXY_MAX_AGE))
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload so changed options take effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    
+
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        await async_cancel_capture(hass, entry.entry_id)
+        if coordinator is not None:
+            await async_detach_proxy(hass, coordinator)
+        if entry.data.get(CONF_TRANSPORT, TRANSPORT_HUB) != TRANSPORT_HUB:
+            await async_release_client(hass, entry.data)
+
+    return unload_ok
 
-    return unload_ok
\ No newline at end of file
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the registers found unsupported on the removed unit."""
+    await unsupported_store(hass, entry).async_remove()
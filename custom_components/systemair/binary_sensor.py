@@ -1,12 +1,14 @@
 import logging
+from dataclasses import dataclass
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
+    BinarySensorEntityDescription,
     BinarySensorDeviceClass
 )
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.const import CONF_MODEL
 from homeassistant.components.modbus.const import CALL_TYPE_REGISTER_HOLDING
-from .const import DOMAIN, CONF_SLAVE
+from .const import DOMAIN
+from .entity import SystemairEntity, SystemairEntityDescription
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,58 +30,41 @@ SYSTEMAIR_BOOLEANS = [
     ("maintenance_mode", 15000, None, "mdi:wrench-clock", EntityCategory.DIAGNOSTIC), 
 ]
 
+@dataclass(frozen=True, kw_only=True)
+class SystemairBinarySensorEntityDescription(SystemairEntityDescription, BinarySensorEntityDescription):
+    register: int
+
+BINARY_SENSOR_DESCRIPTIONS = tuple(
+    SystemairBinarySensorEntityDescription(
+        key=key,
+        translation_key=key,
+        register=register,
+        registers=((CALL_TYPE_REGISTER_HOLDING, (register,)),),
+        device_class=device_class,
+        icon=icon,
+        entity_category=category,
+    )
+    for key, register, device_class, icon, category in SYSTEMAIR_BOOLEANS
+)
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up Systemair binary sensors."""
-    config = entry.data
-    from homeassistant.components.modbus import get_hub
-    hub = get_hub(hass, config.get("hub_name", "modbus_hub"))
-    
-    if hub is None:
-        _LOGGER.error("Systemair: Modbus hub not found for binary sensors")
-        return
-
-    model = config.get(CONF_MODEL, "SAVE")
-    slave = config.get(CONF_SLAVE, 1)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities([
-        SystemairBinarySensor(hub, model, slave, *b) 
-        for b in SYSTEMAIR_BOOLEANS
-    ], True)
+        SystemairBinarySensor(coordinator, d)
+        for d in BINARY_SENSOR_DESCRIPTIONS
+    ])
 
-class SystemairBinarySensor(BinarySensorEntity):
+class SystemairBinarySensor(SystemairEntity, BinarySensorEntity):
     """Generic Systemair Binary Sensor using translation keys."""
-    
-    _attr_has_entity_name = True
-
-    def __init__(self, hub, model, slave, translation_key, address, device_class, icon, category):
-        self._hub = hub
-        self._slave = slave
-        self._model = model
-        self._register = address
-        
-        self._attr_translation_key = translation_key
-        self._attr_device_class = device_class
-        self._attr_icon = icon
-        self._attr_entity_category = category
-        self._attr_unique_id = f"{DOMAIN}_{slave}_bin_{address}_{translation_key}"
+    entity_description: SystemairBinarySensorEntityDescription
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, f"{self._model}_{self._slave}")},
-            "name": f"Systemair {self._model}",
-            "manufacturer": "Systemair",
-            "model": f"SAVE {self._model}",
-        }
+    def __init__(self, coordinator, description):
+        super().__init__(coordinator, description)
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slave}_bin_{description.register}_{description.key}"
 
-    async def async_update(self):
-        """Fetch binary status from Modbus."""
-        try:
-            result = await self._hub.async_pb_call(
-                self._slave, self._register, 1, CALL_TYPE_REGISTER_HOLDING
-            )
-            
-            if result and hasattr(result, 'registers'):
-                self._attr_is_on = bool(result.registers[0] > 0)
-        except Exception as e:
-            _LOGGER.error("Systemair: Failed to update binary sensor %s: %s", self._attr_translation_key, e)
\ No newline at end of file
+    def _update_from_snapshot(self):
+        """Binary status from the register snapshot."""
+        if (val := self.coordinator.registers.get(self.entity_description.register)) is not None:
+            self._attr_is_on = bool(val > 0)
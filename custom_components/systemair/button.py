@@ -1,9 +1,8 @@
-import asyncio
 import logging
-from homeassistant.components.button import ButtonEntity
-from homeassistant.const import CONF_MODEL
-from homeassistant.components.modbus.const import CALL_TYPE_WRITE_REGISTER
-from .const import DOMAIN, CONF_SLAVE
+from dataclasses import dataclass
+from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
+from .const import DOMAIN
+from .entity import SystemairEntity, SystemairEntityDescription
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,63 +23,44 @@ VENT_ACTIONS = {
 }
 
 
+@dataclass(frozen=True, kw_only=True)
+class SystemairButtonEntityDescription(SystemairEntityDescription, ButtonEntityDescription):
+    mode_val: int
+    speed_val: int | None = None
+
+BUTTON_DESCRIPTIONS = tuple(
+    SystemairButtonEntityDescription(
+        key=key,
+        translation_key=key,
+        icon="mdi:play-box-outline",
+        mode_val=mode,
+        speed_val=speed,
+    )
+    for key, (mode, speed) in VENT_ACTIONS.items()
+)
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up SystemAir buttons from a config entry."""
-    config = entry.data
-    from homeassistant.components.modbus import get_hub
-    hub = get_hub(hass, config.get("hub_name", "modbus_hub"))
-    
-    if hub is None:
-        _LOGGER.error("SystemAir: Modbus hub not found for buttons")
-        return
-
-    model = config.get(CONF_MODEL, "SAVE")
-    slave = config.get(CONF_SLAVE, 1)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [
-        SystemAirButton(hub, model, slave, key, mode, speed)
-        for key, (mode, speed) in VENT_ACTIONS.items()
-    ]
-    
-    async_add_entities(entities)
+    async_add_entities([SystemAirButton(coordinator, d) for d in BUTTON_DESCRIPTIONS])
 
-class SystemAirButton(ButtonEntity):
+class SystemAirButton(SystemairEntity, ButtonEntity):
     """Generic SystemAir Action Button using translation keys."""
-    
-    _attr_has_entity_name = True
+    entity_description: SystemairButtonEntityDescription
 
-    def __init__(self, hub, model, slave, translation_key, mode_val, speed_val):
-        self._hub = hub
-        self._slave = slave
-        self._model = model
-        self._mode_val = mode_val
-        self._speed_val = speed_val
-        
-        self._attr_translation_key = translation_key
-        self._attr_unique_id = f"{DOMAIN}_{slave}_btn_{translation_key}"
-        self._attr_icon = "mdi:play-box-outline"
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, f"{self._model}_{self._slave}")},
-            "name": f"Systemair {self._model}",
-            "manufacturer": "Systemair",
-            "model": f"SAVE {self._model}",
-        }
+    def __init__(self, coordinator, description):
+        super().__init__(coordinator, description)
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slave}_btn_{description.key}"
 
     async def async_press(self) -> None:
         """Handle the button press."""
+        desc = self.entity_description
         try:
-            # 1. Skriv til Modus-register (1161)
-            await self._hub.async_pb_call(self._slave, 1161, self._mode_val, CALL_TYPE_WRITE_REGISTER)
-            
-            # 2. Skriv viftehastighet hvis definert (brukes for Manuelle moduser/Stop)
-            if self._speed_val is not None:
-                await asyncio.sleep(1.0)
-                await self._hub.async_pb_call(self._slave, 1130, self._speed_val, CALL_TYPE_WRITE_REGISTER)
+            # Modus (1161) + viftehastighet (1130) hvis definert; hopper over det anlegget allerede står i
+            await self.coordinator.async_set_user_mode(desc.mode_val, desc.speed_val)
             
             _LOGGER.debug("SystemAir: Button %s pressed, mode %s, speed %s", 
-                         self._attr_translation_key, self._mode_val, self._speed_val)
+                         desc.key, desc.mode_val, desc.speed_val)
         except Exception as e:
-            _LOGGER.error("SystemAir Button '%s' failed: %s", self._attr_translation_key, e)
\ No newline at end of file
+            _LOGGER.error("SystemAir Button '%s' failed: %s", desc.key, e)
@@ -0,0 +1,199 @@
+import logging
+from datetime import datetime, time, timedelta
+from homeassistant.components.calendar import (
+    CalendarEntity,
+    CalendarEntityFeature,
+    CalendarEvent,
+    EVENT_START,
+    EVENT_END,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from homeassistant.components.modbus.const import CALL_TYPE_REGISTER_HOLDING
+from .const import (
+    DOMAIN,
+    DAYS,
+    TIER_CONFIG,
+    SCHEDULE_TIME_BASE,
+    SCHEDULE_ENABLE_BASE,
+    SCHEDULE_PERIODS,
+)
+from .entity import SystemairEntity, signed
+
+_LOGGER = logging.getLogger(__name__)
+
+# Block 1: 5000/5001 offsets + 56 time registers, block 2: 14 enable flags
+OFFSETS_REG = 5000
+TIMES_COUNT = len(DAYS) * SCHEDULE_PERIODS * 4
+ENABLE_COUNT = len(DAYS) * SCHEDULE_PERIODS
+WEEKLY_RRULE = "FREQ=WEEKLY;BYDAY={}"
+RRULE_DAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up the weekly schedule calendar."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([SystemairScheduleCalendar(coordinator)])
+
+class SystemairScheduleCalendar(SystemairEntity, CalendarEntity):
+    """The unit's whole weekly schedule as one calendar of weekly recurring events.
+
+    Each of the 14 periods (day x P1/P2) is one event series with uid "<day>_<period>",
+    e.g. "mon_p1". Edits always apply to the whole series since the unit only knows
+    a weekly pattern.
+    """
+
+    _attr_translation_key = "weekly_schedule"
+    _attr_icon = "mdi:calendar-clock"
+    _attr_supported_features = (
+        CalendarEntityFeature.CREATE_EVENT
+        | CalendarEntityFeature.UPDATE_EVENT
+        | CalendarEntityFeature.DELETE_EVENT
+    )
+    # Read by the config sweep even though the calendar is not a config entity
+    _poll_tier = TIER_CONFIG
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slave}_schedule_calendar"
+        # Index day * SCHEDULE_PERIODS + period -> (start, end, enabled)
+        self._periods = []
+        self._offsets = None
+
+    @property
+    def event(self):
+        """The active period, or the next one coming up."""
+        now = dt_util.now()
+        upcoming = self._events_between(now, now + timedelta(days=8))
+        return upcoming[0] if upcoming else None
+
+    @property
+    def extra_state_attributes(self):
+        if self._offsets is None:
+            return None
+        return {"active_offset": self._offsets[0], "inactive_offset": self._offsets[1]}
+
+    async def async_get_events(self, hass, start_date, end_date):
+        return self._events_between(start_date, end_date)
+
+    def _events_between(self, start_date, end_date):
+        events = []
+        # Start a day early so periods running past midnight are included
+        day = dt_util.as_local(start_date).date() - timedelta(days=1)
+        while day <= dt_util.as_local(end_date).date():
+            for period in range(SCHEDULE_PERIODS):
+                idx = day.weekday() * SCHEDULE_PERIODS + period
+                if idx >= len(self._periods) or not self._periods[idx][2]:
+                    continue
+                event = self._build_event(day, period, *self._periods[idx][:2])
+                if event.end > start_date and event.start < end_date:
+                    events.append(event)
+            day += timedelta(days=1)
+        events.sort(key=lambda e: e.start)
+        return events
+
+    def _build_event(self, day, period, start, end):
+        tz = dt_util.get_default_time_zone()
+        dt_start = datetime.combine(day, start, tzinfo=tz)
+        dt_end = datetime.combine(day, end, tzinfo=tz)
+        if dt_end <= dt_start:
+            dt_end += timedelta(days=1)
+        return CalendarEvent(
+            start=dt_start,
+            end=dt_end,
+            summary=f"P{period + 1}",
+            uid=f"{DAYS[day.weekday()]}_p{period + 1}",
+            recurrence_id=dt_start.strftime("%Y%m%dT%H%M%S"),
+            rrule=WEEKLY_RRULE.format(RRULE_DAYS[day.weekday()]),
+        )
+
+    def _ensure_loaded(self):
+        if len(self._periods) != ENABLE_COUNT:
+            raise HomeAssistantError("The Systemair schedule has not been read from the unit yet")
+
+    def _parse_times(self, event):
+        self._ensure_loaded()
+        start, end = event[EVENT_START], event[EVENT_END]
+        if not isinstance(start, datetime) or not isinstance(end, datetime):
+            raise HomeAssistantError("The Systemair schedule does not support all-day events")
+        start, end = dt_util.as_local(start), dt_util.as_local(end)
+        if end - start > timedelta(days=1) or end <= start:
+            raise HomeAssistantError("A schedule period must be shorter than one day")
+        return start.weekday(), start.time().replace(second=0), end.time().replace(second=0)
+
+    def _parse_uid(self, uid):
+        self._ensure_loaded()
+        try:
+            day, period = uid.split("_p")
+            return DAYS.index(day), int(period) - 1
+        except ValueError as err:
+            raise HomeAssistantError(f"Unknown schedule period '{uid}'") from err
+
+    def _free_period(self, weekday):
+        for period in range(SCHEDULE_PERIODS):
+            if not self._periods[weekday * SCHEDULE_PERIODS + period][2]:
+                return period
+        raise HomeAssistantError(f"Both schedule periods on {DAYS[weekday]} are already in use")
+
+    async def async_create_event(self, **kwargs):
+        weekday, start, end = self._parse_times(kwargs)
+        await self._async_write_period(weekday, self._free_period(weekday), start, end, True)
+
+    async def async_update_event(self, uid, event, recurrence_id=None, recurrence_range=None):
+        day, period = self._parse_uid(uid)
+        weekday, start, end = self._parse_times(event)
+        if weekday == day:
+            await self._async_write_period(day, period, start, end, True)
+            return
+        # Moved to another weekday: take a slot on the new day, then free this one,
+        # so a full day leaves the original period in place
+        new_period = self._free_period(weekday)
+        await self._async_write_period(weekday, new_period, start, end, True)
+        await self._async_write_enable(day, period, False)
+
+    async def async_delete_event(self, uid, recurrence_id=None, recurrence_range=None):
+        day, period = self._parse_uid(uid)
+        await self._async_write_enable(day, period, False)
+
+    async def _async_write_period(self, day, period, start, end, enabled):
+        """Write the 4 time registers in one request, then the enable flag."""
+        idx = day * SCHEDULE_PERIODS + period
+        # Same convention as the unit: a period ending at midnight ends at 24:00
+        end_hour = 24 if end == time(0) else end.hour
+        values = [start.hour, start.minute, end_hour, end.minute]
+        if not await self.coordinator.async_write_registers(SCHEDULE_TIME_BASE + idx * 4, values):
+            raise HomeAssistantError(f"Failed to write schedule period {DAYS[day]}_p{period + 1}")
+        await self._async_write_enable(day, period, enabled)
+
+    async def _async_write_enable(self, day, period, enabled):
+        idx = day * SCHEDULE_PERIODS + period
+        if self._periods[idx][2] == enabled:
+            return
+        if not await self.coordinator.async_write_register(SCHEDULE_ENABLE_BASE + idx, int(enabled)):
+            raise HomeAssistantError(f"Failed to write schedule period {DAYS[day]}_p{period + 1}")
+
+    def _tracked_registers(self):
+        return [(CALL_TYPE_REGISTER_HOLDING, [
+            *range(OFFSETS_REG, SCHEDULE_TIME_BASE + TIMES_COUNT),
+            *range(SCHEDULE_ENABLE_BASE, SCHEDULE_ENABLE_BASE + ENABLE_COUNT),
+        ])]
+
+    def _update_from_snapshot(self):
+        """Decode the schedule (5000-5057 and 5100-5113) from the snapshot."""
+        regs = self.coordinator.registers
+        if regs.get(OFFSETS_REG) is not None and regs.get(OFFSETS_REG + 1) is not None:
+            self._offsets = (signed(regs[OFFSETS_REG]) / 10, signed(regs[OFFSETS_REG + 1]) / 10)
+
+        periods = []
+        for idx in range(ENABLE_COUNT):
+            base = SCHEDULE_TIME_BASE + idx * 4
+            sh, sm, eh, em = (regs.get(base + i) for i in range(4))
+            enabled = regs.get(SCHEDULE_ENABLE_BASE + idx)
+            if None in (sh, sm, eh, em, enabled):
+                # Not read yet; the sweep may bring the schedule in over several cycles
+                return
+            valid = sh <= 23 and sm <= 59 and eh <= 24 and em <= 59
+            start = time(sh, sm) if valid else time(0)
+            # 24:00 is used by the unit for "end of day"
+            end = time(0) if not valid or eh == 24 else time(eh, em)
+            periods.append((start, end, valid and enabled == 1))
+        self._periods = periods
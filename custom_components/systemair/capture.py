@@ -0,0 +1,105 @@
+"""Burst capture: one unit's live measurements at a high rate into a CSV file.
+
+For fan balancing and heater tuning. While a capture runs the unit reads only
+the capture registers (see SystemairCoordinator.async_burst) and every sample
+becomes one CSV row; the normal schedule resumes by itself when it ends.
+"""
+import csv
+import logging
+import time
+
+from homeassistant.components.modbus.const import (
+    CALL_TYPE_REGISTER_HOLDING,
+    CALL_TYPE_REGISTER_INPUT,
+)
+from homeassistant.util import dt as dt_util
+from .entity import signed
+
+_LOGGER = logging.getLogger(__name__)
+
+# (column, call type, register, scale, signed)
+CAPTURE_COLUMNS = (
+    ("outdoor_temp", CALL_TYPE_REGISTER_INPUT, 12101, 0.1, True),
+    ("supply_temp", CALL_TYPE_REGISTER_INPUT, 12102, 0.1, True),
+    ("temp_12103", CALL_TYPE_REGISTER_INPUT, 12103, 0.1, True),
+    ("temp_12104", CALL_TYPE_REGISTER_INPUT, 12104, 0.1, True),
+    ("extract_temp", CALL_TYPE_REGISTER_INPUT, 12105, 0.1, True),
+    ("eff_temp", CALL_TYPE_REGISTER_INPUT, 12106, 0.1, True),
+    ("overheat_temp", CALL_TYPE_REGISTER_INPUT, 12107, 0.1, True),
+    ("exhaust_temp", CALL_TYPE_REGISTER_INPUT, 12543, 0.1, True),
+    ("rel_moisture", CALL_TYPE_REGISTER_INPUT, 12135, 1, False),
+    ("sf_rpm", CALL_TYPE_REGISTER_INPUT, 12400, 1, False),
+    ("ef_rpm", CALL_TYPE_REGISTER_INPUT, 12401, 1, False),
+    ("sf_speed_pct", CALL_TYPE_REGISTER_INPUT, 14000, 1, False),
+    ("ef_speed_pct", CALL_TYPE_REGISTER_INPUT, 14001, 1, False),
+    ("heater_pct", CALL_TYPE_REGISTER_HOLDING, 2148, 1, False),
+)
+CAPTURE_KEYS = [(call_type, addr) for _, call_type, addr, _, _ in CAPTURE_COLUMNS]
+
+# Rows buffered before they are handed to the executor for writing
+FLUSH_ROWS = 20
+
+
+class BurstCapture:
+    """One capture of one unit into `path`."""
+
+    def __init__(self, hass, coordinator, path):
+        self.hass = hass
+        self.coordinator = coordinator
+        self.path = path
+        self.samples = 0
+        self.failed = 0
+        self._file = None
+        self._writer = None
+        self._rows = []
+        self._started = 0.0
+
+    async def async_run(self, rate, duration):
+        self._file = await self.hass.async_add_executor_job(self._open)
+        self._started = time.monotonic()
+        try:
+            await self.coordinator.async_burst(CAPTURE_KEYS, rate, duration, self._async_sample)
+        finally:
+            rows, self._rows = self._rows, []
+            await self.hass.async_add_executor_job(self._write, rows, True)
+        _LOGGER.info(
+            "Systemair %s: Captured %d samples (%d incomplete) to %s",
+            self.coordinator.slave, self.samples, self.failed, self.path,
+        )
+
+    async def _async_sample(self, read_s, failed):
+        regs = self.coordinator.registers
+        row = [
+            dt_util.now().isoformat(timespec="milliseconds"),
+            round(time.monotonic() - self._started, 3),
+            round(read_s * 1000),
+        ]
+        unsupported = self.coordinator.unsupported
+        for _, call_type, addr, scale, is_signed in CAPTURE_COLUMNS:
+            # Columns of a block that failed this time are left empty, and so
+            # are registers the unit does not have
+            key = (call_type, addr)
+            value = None if key in failed or key in unsupported else regs.get(addr)
+            if value is not None and is_signed:
+                value = signed(value)
+            row.append("" if value is None else round(value * scale, 1))
+        self._rows.append(row)
+        self.samples += 1
+        # Only reads that failed make a sample incomplete
+        self.failed += bool(failed)
+        if len(self._rows) >= FLUSH_ROWS:
+            rows, self._rows = self._rows, []
+            await self.hass.async_add_executor_job(self._write, rows, False)
+
+    def _open(self):
+        file = open(self.path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(file)
+        self._writer.writerow(["time", "elapsed_s", "read_ms", *(column for column, *_ in CAPTURE_COLUMNS)])
+        return file
+
+    def _write(self, rows, close):
+        self._writer.writerows(rows)
+        if close:
+            self._file.close()
+        else:
+            self._file.flush()
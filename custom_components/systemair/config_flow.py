@@ -1,40 +1,359 @@
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.const import CONF_MODEL
-from .const import DOMAIN, CONF_SLAVE
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.const import CONF_MODEL, CONF_HOST, CONF_PORT, CONF_TIMEOUT, CONF_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_SLAVE,
+    CONF_HUB_NAME,
+    CONF_TRANSPORT,
+    TRANSPORT_HUB,
+    TRANSPORTS,
+    CONF_CONNECTIONS,
+    CONF_FRAME_DELAY,
+    CONF_RECONNECT_DELAY,
+    CONF_RECONNECT_DELAY_MAX,
+    CONF_BAUDRATE,
+    CONF_BYTESIZE,
+    CONF_PARITY,
+    CONF_STOPBITS,
+    DEFAULT_HUB_NAME,
+    DEFAULT_TCP_PORT,
+    DEFAULT_CONNECTIONS,
+    DEFAULT_FRAME_DELAY,
+    DEFAULT_TIMEOUT,
+    DEFAULT_RECONNECT_DELAY,
+    DEFAULT_RECONNECT_DELAY_MAX,
+    DEFAULT_BAUDRATE,
+    DEFAULT_BYTESIZE,
+    DEFAULT_PARITY,
+    DEFAULT_STOPBITS,
+    CONF_PROFILE,
+    PROFILE_FULL,
+    PROFILE_LEAN,
+    PROFILES,
+    LEAN_OPTIONAL,
+    SCHEDULE_KEYS,
+    CONF_CONFIG_BUDGET,
+    CONF_WRITE_WINDOW,
+    CONF_SNAPSHOT_EVENT,
+    CONF_PROXY_PORT,
+    CONF_PROXY_MAX_AGE,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_PROXY_MAX_AGE,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_CONFIG_BUDGET,
+    DEFAULT_WRITE_WINDOW,
+    CONF_DISCOVER,
+    CONF_SLAVE_FROM,
+    CONF_SLAVE_TO,
+    CONF_UNITS,
+)
+from .discovery import DISCOVERY_TIMEOUT, async_discover, suggest_scan_interval
+from .transport import DATA_TRANSPORTS, pool_key, create_client
 
 
 SUPPORTED_MODELS = [
-    "VSR 300", "VSR 400", "VSR 500",   
-    "VTR 300", "VTR 400", "VTR 500",  
+    "VSR 300", "VSR 400", "VSR 500",
+    "VTR 300", "VTR 400", "VTR 500",
     "VTC 300", "VTC 500", "VTC 700",
 ]
 
 # The code was originally created and tested for the VSR300.
 # All of them are supported, but bigger models can have alternative sensor ranges based on selected model.
-# This must be added on request. 
+# This must be added on request.
 # The VTC have a bypass opening instead of heat converter. This is not added into the code per 2.2.26
 
+# Pacing/backoff fields shared by the direct TCP and RTU steps
+TIMING_SCHEMA = {
+    vol.Required(CONF_FRAME_DELAY, default=DEFAULT_FRAME_DELAY): vol.All(int, vol.Range(min=0, max=1000)),
+    vol.Required(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+    vol.Required(CONF_RECONNECT_DELAY, default=DEFAULT_RECONNECT_DELAY): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=60)),
+    vol.Required(CONF_RECONNECT_DELAY_MAX, default=DEFAULT_RECONNECT_DELAY_MAX): vol.All(vol.Coerce(float), vol.Range(min=1, max=3600)),
+}
+
 class SaveVSRConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a generic config flow for SaveVSR."""
     VERSION = 1
 
+    def __init__(self):
+        self._data = {}
+        # Discovery: slave -> round-trip time (s) of the units found
+        self._found = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return SaveVSROptionsFlow()
+
     async def async_step_user(self, user_input=None):
         """Initial step for the Systemair setup."""
         if user_input is not None:
-            # title shows up in the 'Integrations' list card
-            return self.async_create_entry(
-                title=f"Systemair {user_input[CONF_MODEL]}", 
-                data=user_input
-            )
+            self._data.update(user_input)
+            # Each transport has its own follow-up step (hub / tcp / rtu)
+            return await getattr(self, f"async_step_{user_input[CONF_TRANSPORT]}")()
 
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema({
                 # Change from a string input to a select list
                 vol.Required(CONF_MODEL, default=SUPPORTED_MODELS[0]): vol.In(SUPPORTED_MODELS),
-                # This must match the 'name' in configuration.yaml
-                vol.Required("hub_name", default="save_hub"): str,
+                vol.Required(CONF_TRANSPORT, default=TRANSPORT_HUB): vol.In(TRANSPORTS),
                 vol.Required(CONF_SLAVE, default=1): int,
+                vol.Required(CONF_DISCOVER, default=False): bool,
+                vol.Required(CONF_PROFILE, default=PROFILE_FULL): vol.In(PROFILES),
+            })
+        )
+
+    async def async_step_hub(self, user_input=None):
+        """Use a hub from the modbus integration (configuration.yaml)."""
+        if user_input is not None:
+            return await self._async_connected(user_input)
+
+        return self.async_show_form(
+            step_id="hub",
+            data_schema=vol.Schema({
+                # This must match the 'name' in configuration.yaml
+                vol.Required(CONF_HUB_NAME, default=DEFAULT_HUB_NAME): str,
+            })
+        )
+
+    async def async_step_tcp(self, user_input=None):
+        """Direct Modbus TCP connection to a gateway."""
+        errors = {}
+        if user_input is not None:
+            if await self._async_test_connection(user_input):
+                return await self._async_connected(user_input)
+            errors["base"] = "cannot_connect"
+
+        return self.async_show_form(
+            step_id="tcp",
+            data_schema=vol.Schema({
+                vol.Required(CONF_HOST): str,
+                vol.Required(CONF_PORT, default=DEFAULT_TCP_PORT): int,
+                vol.Required(CONF_CONNECTIONS, default=DEFAULT_CONNECTIONS): vol.All(int, vol.Range(min=1, max=4)),
+                **TIMING_SCHEMA,
+            }),
+            errors=errors,
+        )
+
+    async def async_step_rtu(self, user_input=None):
+        """Direct Modbus RTU on a local serial port."""
+        errors = {}
+        if user_input is not None:
+            if await self._async_test_connection(user_input):
+                return await self._async_connected(user_input)
+            errors["base"] = "cannot_connect"
+
+        return self.async_show_form(
+            step_id="rtu",
+            data_schema=vol.Schema({
+                vol.Required(CONF_PORT, default="/dev/ttyUSB0"): str,
+                vol.Required(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): int,
+                vol.Required(CONF_BYTESIZE, default=DEFAULT_BYTESIZE): vol.In([7, 8]),
+                vol.Required(CONF_PARITY, default=DEFAULT_PARITY): vol.In(["N", "E", "O"]),
+                vol.Required(CONF_STOPBITS, default=DEFAULT_STOPBITS): vol.In([1, 2]),
+                **TIMING_SCHEMA,
+            }),
+            errors=errors,
+        )
+
+    async def _async_test_connection(self, user_input) -> bool:
+        config = {**self._data, **user_input}
+        # A line already in use by other units is tested through their client
+        # (a serial port cannot be opened twice)
+        shared = self.hass.data.get(DOMAIN, {}).get(DATA_TRANSPORTS, {}).get(pool_key(config))
+        if shared is not None:
+            return await shared[0].async_connect()
+
+        client = create_client(config)
+        try:
+            return await client.async_connect()
+        finally:
+            await client.async_close()
+
+    async def _async_connected(self, user_input):
+        """Connection settings are complete: create the entry or go look for units."""
+        if self._data.pop(CONF_DISCOVER, False):
+            self._data.update(user_input)
+            return await self.async_step_discover()
+        return self._async_create(user_input)
+
+    def _async_create(self, user_input):
+        self._data.update(user_input)
+        # title shows up in the 'Integrations' list card
+        return self.async_create_entry(
+            title=f"Systemair {self._data[CONF_MODEL]}",
+            data=self._data
+        )
+
+    async def async_step_discover(self, user_input=None):
+        """Probe a range of slave IDs on the chosen connection."""
+        errors = {}
+        if user_input is not None:
+            slaves = [
+                s for s in range(user_input[CONF_SLAVE_FROM], user_input[CONF_SLAVE_TO] + 1)
+                if s not in self._configured_slaves()
+            ]
+            self._found = await self._async_discover(slaves)
+            if self._found:
+                return await self.async_step_discover_confirm()
+            errors["base"] = "no_units_found"
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema({
+                vol.Required(CONF_SLAVE_FROM, default=1): vol.All(int, vol.Range(min=1, max=247)),
+                vol.Required(CONF_SLAVE_TO, default=16): vol.All(int, vol.Range(min=1, max=247)),
+            }),
+            errors=errors,
+        )
+
+    async def async_step_discover_confirm(self, user_input=None):
+        """Pick the units to add; all of them are set up in one go."""
+        suggested = suggest_scan_interval(self._found.values())
+        if user_input is not None:
+            slaves = sorted(int(s) for s in user_input[CONF_UNITS])
+            if slaves:
+                units = [
+                    {**self._data, CONF_SLAVE: slave, CONF_SCAN_INTERVAL: user_input[CONF_SCAN_INTERVAL]}
+                    for slave in slaves
+                ]
+                # A flow creates one entry; the others go through their own import flows
+                for data in units[1:]:
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN, context={"source": config_entries.SOURCE_IMPORT}, data=data
+                        )
+                    )
+                return await self.async_step_import(units[0])
+
+        units = {
+            str(slave): f"Slave {slave} – {self._data[CONF_MODEL]} ({rtt * 1000:.0f} ms)"
+            for slave, rtt in sorted(self._found.items())
+        }
+        return self.async_show_form(
+            step_id="discover_confirm",
+            data_schema=vol.Schema({
+                vol.Required(CONF_UNITS, default=list(units)): cv.multi_select(units),
+                vol.Required(CONF_SCAN_INTERVAL, default=suggested): vol.All(int, vol.Range(min=2, max=3600)),
+            }),
+            description_placeholders={"count": str(len(units)), "scan_interval": str(suggested)},
+        )
+
+    async def async_step_import(self, data):
+        """Create an entry for one discovered unit."""
+        await self.async_set_unique_id(_unit_id(data))
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=f"Systemair {data[CONF_MODEL]} ({data[CONF_SLAVE]})", data=data)
+
+    def _configured_slaves(self):
+        """Slave IDs already set up on the same hub or line."""
+        transport = self._data.get(CONF_TRANSPORT, TRANSPORT_HUB)
+
+        def same_line(data):
+            if data.get(CONF_TRANSPORT, TRANSPORT_HUB) != transport:
+                return False
+            if transport == TRANSPORT_HUB:
+                return data.get(CONF_HUB_NAME) == self._data.get(CONF_HUB_NAME)
+            return pool_key(data) == pool_key(self._data)
+
+        return {
+            entry.data.get(CONF_SLAVE) for entry in self._async_current_entries(include_ignore=False)
+            if same_line(entry.data)
+        }
+
+    async def _async_discover(self, slaves):
+        if self._data.get(CONF_TRANSPORT, TRANSPORT_HUB) == TRANSPORT_HUB:
+            # The hub serializes requests, so the IDs are probed one at a time
+            # with the hub's own timeout (cancelling a request could desync the line)
+            from homeassistant.components.modbus import get_hub
+            try:
+                hub = get_hub(self.hass, self._data[CONF_HUB_NAME])
+            except KeyError:
+                hub = None
+            return await async_discover(hub, slaves, concurrent=False) if hub is not None else {}
+
+        # A line already in use by other units is probed through their client
+        # (a serial port cannot be opened twice), otherwise with a short timeout
+        shared = self.hass.data.get(DOMAIN, {}).get(DATA_TRANSPORTS, {}).get(pool_key(self._data))
+        if shared is not None:
+            return await async_discover(shared[0], slaves, concurrent=False)
+
+        client = create_client({**self._data, CONF_TIMEOUT: DISCOVERY_TIMEOUT})
+        try:
+            await client.async_connect()
+            return await async_discover(client, slaves)
+        finally:
+            await client.async_close()
+
+
+class SaveVSROptionsFlow(config_entries.OptionsFlow):
+    """Options that can be changed after setup."""
+
+    async def async_step_init(self, user_input=None):
+        entry = self.config_entry
+        current = {**entry.data, **entry.options}
+        profile = current.get(CONF_PROFILE, PROFILE_FULL)
+
+        if user_input is not None:
+            if user_input[CONF_PROFILE] != profile:
+                _apply_profile(self.hass, entry, user_input[CONF_PROFILE])
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(CONF_PROFILE, default=profile): vol.In(PROFILES),
+                vol.Required(
+                    CONF_SCAN_INTERVAL, default=current.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                ): vol.All(int, vol.Range(min=2, max=3600)),
+                vol.Required(
+                    CONF_CONFIG_BUDGET, default=current.get(CONF_CONFIG_BUDGET, DEFAULT_CONFIG_BUDGET)
+                ): vol.All(int, vol.Range(min=50, max=5000)),
+                vol.Required(
+                    CONF_WRITE_WINDOW, default=current.get(CONF_WRITE_WINDOW, DEFAULT_WRITE_WINDOW)
+                ): vol.All(int, vol.Range(min=0, max=5000)),
+                vol.Required(
+                    CONF_SNAPSHOT_EVENT, default=current.get(CONF_SNAPSHOT_EVENT, False)
+                ): bool,
+                vol.Required(
+                    CONF_PROXY_PORT, default=current.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT)
+                ): vol.All(int, vol.Range(min=0, max=65535)),
+                vol.Required(
+                    CONF_PROXY_MAX_AGE, default=current.get(CONF_PROXY_MAX_AGE, DEFAULT_PROXY_MAX_AGE)
+                ): vol.All(int, vol.Range(min=0, max=3600)),
             })
-        )
\ No newline at end of file
+        )
+
+
+def _unit_id(data):
+    """Unique ID of a unit: its hub or line plus the slave ID."""
+    if data.get(CONF_TRANSPORT, TRANSPORT_HUB) == TRANSPORT_HUB:
+        line = data.get(CONF_HUB_NAME)
+    else:
+        line = pool_key(data)
+    return f"{line}#{data[CONF_SLAVE]}"
+
+
+@callback
+def _apply_profile(hass, entry, profile):
+    """Disable/re-enable the optional entities that are already registered.
+
+    enabled_default only counts when an entity is first registered, so a profile
+    change has to touch the registry. Entities a user disabled stay disabled.
+    """
+    registry = er.async_get(hass)
+    for reg in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if reg.translation_key not in LEAN_OPTIONAL:
+            continue
+        if profile == PROFILE_LEAN and reg.disabled_by is None:
+            registry.async_update_entity(reg.entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION)
+        elif (
+            profile != PROFILE_LEAN
+            and reg.translation_key not in SCHEDULE_KEYS  # superseded by the calendar
+            and reg.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+        ):
+            registry.async_update_entity(reg.entity_id, disabled_by=None)
@@ -1,2 +1,116 @@
 DOMAIN = "systemair"
-CONF_SLAVE = "slave"
\ No newline at end of file
+CONF_SLAVE = "slave"
+CONF_HUB_NAME = "hub_name"
+
+# --- Transport ---
+# "hub" goes through the modbus integration from configuration.yaml (default),
+# "tcp"/"rtu" use a pymodbus client owned by this integration.
+CONF_TRANSPORT = "transport"
+TRANSPORT_HUB = "hub"
+TRANSPORT_TCP = "tcp"
+TRANSPORT_RTU = "rtu"
+TRANSPORTS = [TRANSPORT_HUB, TRANSPORT_TCP, TRANSPORT_RTU]
+
+CONF_CONNECTIONS = "connections"
+CONF_FRAME_DELAY = "frame_delay"
+CONF_RECONNECT_DELAY = "reconnect_delay"
+CONF_RECONNECT_DELAY_MAX = "reconnect_delay_max"
+CONF_BAUDRATE = "baudrate"
+CONF_BYTESIZE = "bytesize"
+CONF_PARITY = "parity"
+CONF_STOPBITS = "stopbits"
+
+DEFAULT_HUB_NAME = "save_hub"
+DEFAULT_TCP_PORT = 502
+DEFAULT_CONNECTIONS = 1
+DEFAULT_FRAME_DELAY = 20       # ms between frames on one connection
+DEFAULT_TIMEOUT = 3            # s per request
+DEFAULT_RECONNECT_DELAY = 1    # s, doubles on every failed connect...
+DEFAULT_RECONNECT_DELAY_MAX = 60  # ...up to this
+DEFAULT_BAUDRATE = 9600
+DEFAULT_BYTESIZE = 8
+DEFAULT_PARITY = "N"
+DEFAULT_STOPBITS = 1
+
+# --- Entity profile ---
+# "lean" registers the rarely-used entities below as disabled by default.
+# Disabled entities are never added to HA, so they never poll the bus.
+CONF_PROFILE = "profile"
+PROFILE_FULL = "full"
+PROFILE_LEAN = "lean"
+PROFILES = [PROFILE_FULL, PROFILE_LEAN]
+
+DAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# Weekly schedule times (time) and enable toggles (switch). The schedule calendar
+# covers these, so they are always added as disabled.
+SCHEDULE_KEYS = frozenset(
+    [f"{d}_{p}_{e}" for d in DAYS for p in ("p1", "p2") for e in ("start", "end")]
+    + [f"{d}_{p}" for d in DAYS for p in ("p1", "p2")]
+)
+
+# Translation keys (unique across platforms) of the entities the lean profile disables
+LEAN_OPTIONAL = SCHEDULE_KEYS | frozenset(
+    # Weekly schedule offsets
+    ["sched_active_offset", "sched_inactive_offset"]
+    # Per-mode fan RPM setpoints
+    + [f"{f}_{lvl}_rpm" for f in ("sf", "ef") for lvl in ("min", "low", "normal", "high", "max")]
+    + [f"{f}_{m}_setpoint" for f in ("sf", "ef") for m in ("holiday", "hood", "vacuum")]
+    # Summer/winter compensation
+    + [
+        "fan_comp_read", "fan_comp_winter", "winter_comp_temp", "winter_comp_start",
+        "winter_comp_max", "fan_comp_summer", "summer_comp_start", "summer_comp_max",
+    ]
+)
+
+# --- Weekly schedule registers ---
+# 7 days x 2 periods. Times are 4 consecutive registers per period
+# (start hour, start minute, end hour, end minute), enable flags one per period.
+SCHEDULE_TIME_BASE = 5002
+SCHEDULE_ENABLE_BASE = 5100
+SCHEDULE_PERIODS = 2
+
+# --- Polling ---
+DEFAULT_SCAN_INTERVAL = 30     # s
+# Bus time (ms) each cycle may spend on the rotating config register sweep
+CONF_CONFIG_BUDGET = "config_budget"
+DEFAULT_CONFIG_BUDGET = 250
+
+# Live registers are read every cycle, config registers by the rotating sweep,
+# slow registers (counters extrapolated locally) every RESYNC_INTERVAL and
+# whenever the user mode changes
+TIER_LIVE = "live"
+TIER_CONFIG = "config"
+TIER_SLOW = "slow"
+RESYNC_INTERVAL = 600          # s
+
+# --- Writes ---
+# Writes to the same register within this window (ms) are merged; only the
+# last value goes out. 0 writes straight away.
+CONF_WRITE_WINDOW = "write_window"
+DEFAULT_WRITE_WINDOW = 250
+
+# --- Discovery (config flow) ---
+CONF_DISCOVER = "discover"
+CONF_SLAVE_FROM = "slave_from"
+CONF_SLAVE_TO = "slave_to"
+CONF_UNITS = "units"
+
+# --- Snapshot event ---
+# Opt-in: one event per unit and poll with every entity state changed since the last one
+CONF_SNAPSHOT_EVENT = "snapshot_event"
+EVENT_SNAPSHOT = f"{DOMAIN}_snapshot"
+
+# --- Unsupported registers ---
+# Modbus exception code for an address the unit does not implement
+ILLEGAL_DATA_ADDRESS = 2
+# Failed reads without an exception code before a single register is given up on
+UNSUPPORTED_STRIKES = 3
+
+# --- Local Modbus TCP proxy ---
+# Port of the server answering other Modbus clients from the snapshot; 0 = off
+CONF_PROXY_PORT = "proxy_port"
+# Oldest value (s) the proxy hands out; 0 = two refresh periods of the register's tier
+CONF_PROXY_MAX_AGE = "proxy_max_age"
+DEFAULT_PROXY_PORT = 0
+DEFAULT_PROXY_MAX_AGE = 0
@@ -0,0 +1,736 @@
+"""Per-unit poll coordinator: block reads into one shared register snapshot."""
+import asyncio
+import logging
+import math
+import time
+from datetime import timedelta
+
+from homeassistant.const import CONF_MODEL, CONF_SCAN_INTERVAL
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.components.modbus.const import (
+    CALL_TYPE_REGISTER_HOLDING,
+    CALL_TYPE_REGISTER_INPUT,
+    CALL_TYPE_WRITE_REGISTER,
+    CALL_TYPE_WRITE_REGISTERS,
+)
+from .const import (
+    DOMAIN,
+    CONF_SLAVE,
+    CONF_HUB_NAME,
+    CONF_TRANSPORT,
+    TRANSPORT_HUB,
+    CONF_CONFIG_BUDGET,
+    CONF_WRITE_WINDOW,
+    CONF_SNAPSHOT_EVENT,
+    EVENT_SNAPSHOT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_CONFIG_BUDGET,
+    DEFAULT_WRITE_WINDOW,
+    TIER_LIVE,
+    TIER_CONFIG,
+    TIER_SLOW,
+    RESYNC_INTERVAL,
+    ILLEGAL_DATA_ADDRESS,
+    UNSUPPORTED_STRIKES,
+)
+from .planner import Block, CostModel, estimate, optimal_blocks, slice_blocks
+from .profiler import NULL_PROFILER
+from .state import REG_USER_MODE, REG_FAN_LEVEL, OperatingState, decode_state
+from .transport import pool_key
+
+_LOGGER = logging.getLogger(__name__)
+
+# User mode: written to 1161, read back from 1160 as (written value - 1).
+# Manual modes also need the fan speed in 1130.
+REG_USER_MODE_CMD = 1161
+# The unit needs a moment after a mode change before it accepts the speed
+MODE_SPEED_DELAY = 1.0
+
+# Share of the scan interval a poll may use; what does not fit waits for the next poll
+DEADLINE_SHARE = 0.8
+# An entity is overdue when a value is older than this many refresh periods of its tier
+STALE_FACTOR = 2
+
+# Outcome of one block read
+READ_OK = "ok"
+READ_FAILED = "failed"      # no (usable) answer
+READ_REJECTED = "rejected"  # the unit answered with an illegal address exception
+
+# How often the plan is checked against the learned bus costs, and how far
+# (relative) a cost has to have moved for the blocks to be rebuilt
+REPLAN_INTERVAL = 900          # s
+COST_DRIFT = 0.25
+
+# hass.data[DOMAIN] keys for lines behind a Modbus hub: their cost models and
+# the locks the units on one hub take turns with (line -> CostModel / Lock)
+DATA_COST_MODELS = "cost_models"
+DATA_LINE_LOCKS = "line_locks"
+
+STORAGE_VERSION = 1
+
+
+def _option(entry, key, default):
+    return entry.options.get(key, entry.data.get(key, default))
+
+
+def unsupported_store(hass, entry) -> Store:
+    """Store holding the registers a unit was found not to support."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.unsupported_{entry.entry_id}")
+
+
+class SystemairCoordinator(DataUpdateCoordinator):
+    """Polls one unit and keeps its registers in `registers` (address -> raw uint16).
+
+    Entities tell the coordinator which registers they need (`async_track`), so
+    disabled entities cost nothing. Live registers are read every cycle. Config
+    registers are cut into slices that fit a per-cycle bus-time budget and one
+    slice is read per cycle, round-robin, so a full config refresh is spread
+    over several cycles instead of landing as one burst. Slow registers (the
+    counters the sensors extrapolate) are read every RESYNC_INTERVAL and in the
+    cycle the user mode changes.
+
+    Every poll has a deadline (DEADLINE_SHARE of the scan interval). Blocks that
+    would not fit are carried over and read first in the next poll, and a poll
+    never starts while another is still on the bus. `overdue()` reports the
+    entities whose values are older than their tier should allow.
+
+    With the snapshot event enabled, entities report their rendered state back
+    (`async_collect`) and one EVENT_SNAPSHOT per poll carries every state that
+    changed since the previous event, so consumers need not follow each entity.
+
+    Block boundaries and slice sizes come from a cost model of the line
+    (per-request and per-register bus time) learned from the reads themselves
+    and shared by the units on that line. The plan is rebuilt when the learned
+    costs drift away from the ones it was built with; `plan_info()` shows it.
+
+    A block that fails while the unit is answering otherwise is bisected to find
+    the registers it rejects. Those are kept out of the plan from then on and
+    remembered across restarts, so block reads work on every firmware revision.
+    """
+
+    def __init__(self, hass, entry, hub):
+        self.hub = hub
+        self.slave = entry.data.get(CONF_SLAVE, 1)
+        self.model = entry.data.get(CONF_MODEL, "SAVE")
+        self.entry_id = entry.entry_id
+        self.transport = entry.data.get(CONF_TRANSPORT, TRANSPORT_HUB)
+        # Identifies the bus the unit is on: the HA hub name or the direct connection's line
+        self.line = entry.data.get(CONF_HUB_NAME) if self.transport == TRANSPORT_HUB else pool_key(entry.data)
+        self.label = f"{self.line}#{self.slave}"
+        # Swapped for a ProfileSession while the profile service runs
+        self.profiler = NULL_PROFILER
+        self.last_profile = None
+        # Port of the local Modbus proxy serving this unit, None if it is not served
+        self.proxy_port = None
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{self.slave}",
+            update_interval=timedelta(seconds=_option(entry, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
+        )
+        # Shared by every entity of the unit
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{self.model}_{self.slave}")},
+            name=f"Systemair {self.model}",
+            manufacturer="Systemair",
+            model=f"SAVE {self.model}",
+        )
+        self.registers = {}
+        # Decoded from `registers` on every listener update, see async_update_listeners
+        self.state = OperatingState()
+        # address -> monotonic time the value in `registers` was last confirmed
+        self._read_at = {}
+        # Addresses showing an optimistic value the unit has not confirmed yet
+        self._unconfirmed = set()
+        self._config_budget = _option(entry, CONF_CONFIG_BUDGET, DEFAULT_CONFIG_BUDGET) / 1000
+        self._write_window = _option(entry, CONF_WRITE_WINDOW, DEFAULT_WRITE_WINDOW) / 1000
+        # address -> [latest value, future shared by every caller in the window]
+        self._pending_writes = {}
+
+        self.snapshot_event = _option(entry, CONF_SNAPSHOT_EVENT, False)
+        # entity_id -> state as last sent, and what changed since
+        self._published = {}
+        self._changed = {}
+        self._poll_done = False
+
+        # (call_type, address) -> list of tiers of the entities tracking it
+        self._tracked = {}
+        # entity_id -> [(tier, keys), ...] it tracks, for staleness
+        self._owners = {}
+        self._plan_dirty = True
+        self._live_blocks = []
+        self._planned = {}
+        self._slow_blocks = []
+        # monotonic time the slow blocks are read next; 0 = next cycle
+        self._slow_due = 0.0
+        self._config_slices = []
+        self._sweep_pos = 0
+        # Config slices with registers that were never read; read straight away
+        self._pending_slices = set()
+
+        # Direct clients time their reads themselves; behind a hub the coordinators of a line do
+        own_timing = not hasattr(hub, "cost_model")
+        self.cost_model = (
+            hass.data[DOMAIN].setdefault(DATA_COST_MODELS, {}).setdefault(self.line, CostModel())
+            if own_timing else hub.cost_model
+        )
+        # The hub serializes requests anyway; taking turns here first keeps the
+        # wait behind the other units out of the timed reads
+        self._line_lock = (
+            hass.data[DOMAIN].setdefault(DATA_LINE_LOCKS, {}).setdefault(self.line, asyncio.Lock())
+            if own_timing else None
+        )
+        # Costs the current plan was built with, and when to compare them with the model again
+        self._plan_costs = self.cost_model.costs
+        self._replan_at = 0.0
+
+        self._poll_lock = asyncio.Lock()
+        # Blocks the last poll had no time for; read first in the next one
+        self._carry = []
+        self.carried_over = 0
+        self.last_poll = 0.0    # s the last poll took
+
+        self._store = unsupported_store(hass, entry)
+        # (call_type, address) the unit does not support; never read again
+        self.unsupported = set()
+        # (call_type, address) -> single-register reads that failed without an exception code
+        self._strikes = {}
+
+    async def async_load_unsupported(self):
+        """Restore the registers found unsupported on earlier runs."""
+        if data := await self._store.async_load():
+            self.unsupported = {(call_type, addr) for call_type, addrs in data.items() for addr in addrs}
+            self._plan_dirty = True
+
+    def _unsupported_data(self):
+        data = {}
+        for call_type, addr in sorted(self.unsupported):
+            data.setdefault(call_type, []).append(addr)
+        return data
+
+    @callback
+    def async_track(self, call_type, addresses, tier, owner=None):
+        """Add registers to the poll plan. Returns a callback removing them again.
+
+        `owner` (an entity_id) is used to report which entities hold overdue values.
+        """
+        keys = [(call_type, addr) for addr in addresses]
+        for key in keys:
+            self._tracked.setdefault(key, []).append(tier)
+        group = (tier, keys)
+        if owner is not None:
+            self._owners.setdefault(owner, []).append(group)
+        self._plan_dirty = True
+
+        @callback
+        def _untrack():
+            for key in keys:
+                tiers = self._tracked[key]
+                tiers.remove(tier)
+                if not tiers:
+                    del self._tracked[key]
+            if owner is not None:
+                self._owners[owner].remove(group)
+                if not self._owners[owner]:
+                    del self._owners[owner]
+            self._plan_dirty = True
+
+        return _untrack
+
+    def _costs_drifted(self) -> bool:
+        """True (at most every REPLAN_INTERVAL) if the learned costs moved away from the plan's."""
+        now = time.monotonic()
+        if now < self._replan_at:
+            return False
+        self._replan_at = now + REPLAN_INTERVAL
+        return any(
+            abs(learned - planned) > COST_DRIFT * planned
+            for learned, planned in zip(self.cost_model.costs, self._plan_costs)
+        )
+
+    def _compile_plan(self):
+        """Rebuild the live blocks and the config sweep from the tracked registers.
+
+        Block boundaries and slice sizes follow the bus costs learned so far.
+        """
+        costs = self._plan_costs = self.cost_model.costs
+        groups = {}
+        for (call_type, addr), tiers in self._tracked.items():
+            if (call_type, addr) in self.unsupported:
+                continue
+            # A register is read as often as its most demanding entity needs
+            tier = next(t for t in (TIER_LIVE, TIER_CONFIG, TIER_SLOW) if t in tiers)
+            groups.setdefault((tier, call_type), []).append(addr)
+
+        excluded = {}
+        for call_type, addr in self.unsupported:
+            excluded.setdefault(call_type, set()).add(addr)
+
+        plan = {TIER_LIVE: [], TIER_CONFIG: [], TIER_SLOW: []}
+        for (tier, call_type), addresses in sorted(groups.items()):
+            plan[tier].extend(
+                optimal_blocks(call_type, addresses, *costs, exclude=excluded.get(call_type, frozenset()))
+            )
+        live, config = plan[TIER_LIVE], plan[TIER_CONFIG]
+
+        self._live_blocks = live
+        # (call_type, address) -> tier of every register the plan reads, gaps included
+        self._planned = {
+            (b.call_type, addr): tier
+            for tier, blocks in plan.items() for b in blocks for addr in range(b.start, b.end + 1)
+        }
+        self._slow_blocks = plan[TIER_SLOW]
+        if any(addr not in self.registers for b in self._slow_blocks for addr in range(b.start, b.end + 1)):
+            self._slow_due = 0.0
+        self._config_slices = slice_blocks(config, self._config_budget, *costs)
+        # A replan keeps the sweep going where it was instead of starting over
+        self._sweep_pos %= max(1, len(self._config_slices))
+        # Carried blocks belong to the old plan; never-read slices are caught below
+        self._carry = []
+        self._pending_slices = {
+            idx for idx, blocks in enumerate(self._config_slices)
+            if any(
+                (b.call_type, addr) in self._tracked and addr not in self.registers
+                for b in blocks for addr in range(b.start, b.end + 1)
+            )
+        }
+        self._plan_dirty = False
+        _LOGGER.debug(
+            "Systemair %s: plan has %d live blocks, %d config slices and %d slow blocks, "
+            "predicted %.3fs per poll (request %.1fms, register %.2fms)",
+            self.slave, len(live), len(self._config_slices), len(self._slow_blocks),
+            self.predicted_poll(), costs[0] * 1000, costs[1] * 1000,
+        )
+
+    def _predict(self, blocks):
+        return sum(estimate(block, *self._plan_costs) for block in blocks)
+
+    def predicted_poll(self) -> float:
+        """Predicted bus time (s) of a regular poll: the live blocks and the largest config slice."""
+        return self._predict(self._live_blocks) + max(map(self._predict, self._config_slices), default=0.0)
+
+    def plan_info(self) -> dict:
+        """The current read plan with its predicted bus times, for diagnostics."""
+        def blocks(items):
+            return [f"{b.call_type}:{b.start}+{b.count}" for b in items]
+
+        request_cost, register_cost = self._plan_costs
+        return {
+            "request_cost_ms": round(request_cost * 1000, 2),
+            "register_cost_ms": round(register_cost * 1000, 3),
+            "max_gap": int(request_cost / register_cost),
+            "learned_from_reads": self.cost_model.samples,
+            "predicted_poll_s": round(self.predicted_poll(), 3),
+            "predicted_sweep_s": round(sum(map(self._predict, self._config_slices)), 3),
+            "live_blocks": blocks(self._live_blocks),
+            "config_slices": [blocks(s) for s in self._config_slices],
+            "slow_blocks": blocks(self._slow_blocks),
+        }
+
+    def _next_config_blocks(self):
+        if not self._config_slices:
+            return []
+        indexes = {self._sweep_pos} | self._pending_slices
+        self._pending_slices = set()
+        self._sweep_pos = (self._sweep_pos + 1) % len(self._config_slices)
+        return [b for idx in sorted(indexes) for b in self._config_slices[idx]]
+
+    async def _async_call(self, address, value, call_type):
+        """One request to the hub; behind a Modbus hub successful reads teach the cost model."""
+        if self._line_lock is None:
+            return await self.hub.async_pb_call(self.slave, address, value, call_type)
+        async with self._line_lock:
+            started = time.monotonic()
+            result = await self.hub.async_pb_call(self.slave, address, value, call_type)
+            elapsed = time.monotonic() - started
+        if call_type in (CALL_TYPE_REGISTER_HOLDING, CALL_TYPE_REGISTER_INPUT) and hasattr(result, 'registers'):
+            self.cost_model.add(value, elapsed)
+        return result
+
+    async def _async_read_block(self, block):
+        """Read one block into the snapshot, returning READ_OK, READ_FAILED or READ_REJECTED."""
+        with self.profiler.span("bus", self.label):
+            result = await self._async_call(block.start, block.count, block.call_type)
+        if not (result and hasattr(result, 'registers')):
+            _LOGGER.debug("Systemair %s: Block read %s failed", self.slave, block)
+            # Only the direct transport passes exception responses through
+            if getattr(result, "exception_code", None) == ILLEGAL_DATA_ADDRESS:
+                return READ_REJECTED
+            return READ_FAILED
+        with self.profiler.span("decode", self.label):
+            now = time.monotonic()
+            mode_before = self.registers.get(REG_USER_MODE)
+            for offset, value in enumerate(result.registers):
+                # A coalesced write is still waiting; don't flip the UI back meanwhile
+                if block.start + offset not in self._pending_writes:
+                    self.registers[block.start + offset] = value
+                    self._read_at[block.start + offset] = now
+                    self._unconfirmed.discard(block.start + offset)
+            # Timed modes restart their counter, so a mode change (however it was made,
+            # e.g. a broadcast) resyncs the slow registers in the next poll
+            if (
+                block.call_type == CALL_TYPE_REGISTER_INPUT
+                and block.start <= REG_USER_MODE <= block.end
+                and self.registers.get(REG_USER_MODE) != mode_before
+            ):
+                self._slow_due = 0.0
+            if self._strikes:
+                for addr in range(block.start, block.end + 1):
+                    self._strikes.pop((block.call_type, addr), None)
+        return READ_OK
+
+    async def _async_bisect(self, block, status, deadline):
+        """Split a failed block until the registers failing it are isolated.
+
+        The halves that read fine land in the snapshot as usual. Stops at
+        `deadline`, and when neither half answers and the unit does not answer
+        a read of a register it always has either (it went silent rather than
+        rejecting registers). Returns the number of sub-reads that succeeded.
+        """
+        if block.count == 1:
+            self._strike(block.call_type, block.start, status)
+            return 0
+        half = block.count // 2
+        parts = []
+        for part in (
+            Block(block.call_type, block.start, half),
+            Block(block.call_type, block.start + half, block.count - half),
+        ):
+            if time.monotonic() >= deadline:
+                break
+            parts.append((part, await self._async_read_block(part)))
+        ok = sum(part_status == READ_OK for _, part_status in parts)
+        if (
+            len(parts) == 2
+            and all(part_status == READ_FAILED for _, part_status in parts)
+            and not await self._async_answers()
+        ):
+            return ok
+        for part, part_status in parts:
+            if part_status != READ_OK and time.monotonic() < deadline:
+                ok += await self._async_bisect(part, part_status, deadline)
+        return ok
+
+    async def _async_answers(self) -> bool:
+        """Whether the unit still answers: both halves failing may just be two unsupported registers."""
+        return await self._async_read_block(Block(CALL_TYPE_REGISTER_INPUT, REG_USER_MODE, 1)) == READ_OK
+
+    def _strike(self, call_type, address, status):
+        """Count a failed read of a single register and give up on it when it is clearly unsupported.
+
+        An illegal address answer is proof enough. Without an exception code
+        (the HA hub reports every error the same way) it takes several cycles
+        in a row, so a one-off timeout does not cost a register.
+        """
+        key = (call_type, address)
+        if status == READ_FAILED:
+            self._strikes[key] = self._strikes.get(key, 0) + 1
+            if self._strikes[key] < UNSUPPORTED_STRIKES:
+                return
+        self._strikes.pop(key, None)
+        self.unsupported.add(key)
+        self._plan_dirty = True
+        self._store.async_delay_save(self._unsupported_data, 10)
+        _LOGGER.warning(
+            "Systemair %s: %s register %s is not supported by the unit and is no longer read",
+            self.slave, call_type, address,
+        )
+
+    async def _async_update_data(self):
+        if self._poll_lock.locked():
+            # A refresh requested mid-poll (e.g. update_entity) or during a burst; the running read covers it
+            _LOGGER.debug("Systemair %s: Poll still running, not starting another", self.slave)
+            return self.registers
+        async with self._poll_lock:
+            with self.profiler.span("poll", self.label):
+                return await self._async_poll()
+
+    async def _async_read_until(self, queue, deadline, blocks, statuses):
+        """Read the queued blocks that fit before `deadline`, carrying the rest over."""
+        for block in queue:
+            # Always read at least one block so every poll makes progress
+            if statuses and time.monotonic() + estimate(block, *self._plan_costs) > deadline:
+                self._carry.append(block)
+                continue
+            statuses.append(await self._async_read_block(block))
+            blocks.append(block)
+
+    async def _async_poll(self):
+        if self._plan_dirty or self._costs_drifted():
+            self._compile_plan()
+
+        started = time.monotonic()
+        deadline = started + self.update_interval.total_seconds() * DEADLINE_SHARE
+        carried, self._carry = self._carry, []
+        blocks, statuses = [], []
+        queue = carried + [b for b in self._live_blocks + self._next_config_blocks() if b not in carried]
+        await self._async_read_until(queue, deadline, blocks, statuses)
+        # A user mode change read above has made the slow registers due (see _async_read_block)
+        if self._slow_blocks and started >= self._slow_due:
+            self._slow_due = started + RESYNC_INTERVAL
+            queue = [b for b in self._slow_blocks if b not in carried]
+            await self._async_read_until(queue, deadline, blocks, statuses)
+
+        ok = statuses.count(READ_OK)
+        answered = ok or READ_REJECTED in statuses
+        bisected = 0
+        for block, status in zip(blocks, statuses):
+            if time.monotonic() >= deadline:
+                break
+            # A plain failure only means something if the unit answers otherwise
+            if status == READ_REJECTED or (status == READ_FAILED and ok):
+                bisected += await self._async_bisect(block, status, deadline)
+
+        self.carried_over = len(self._carry)
+        self.last_poll = time.monotonic() - started
+        _LOGGER.debug(
+            "Systemair %s: %d/%d blocks read (%d sub-reads after bisecting, %d carried over) in %.3fs",
+            self.slave, ok, len(blocks), bisected, self.carried_over, self.last_poll,
+        )
+        if blocks and not answered:
+            raise UpdateFailed(f"No response from Systemair unit {self.slave}")
+        self._poll_done = True
+        return self.registers
+
+    async def async_burst(self, keys, rate, duration, on_sample):
+        """Read only the (call_type, address) `keys`, `rate` times a second for `duration` s.
+
+        The poll lock is held throughout, so scheduled polls skip: the config
+        sweep and slow registers pause, and the entities keep rendering the
+        burst values. The keys are grouped into blocks the same way as the poll
+        plan (learned costs, unsupported registers left out). After every read
+        `on_sample(read_s, failed)` is awaited, with the values in `registers`
+        and `failed` the set of keys whose block did not read this time
+        (unsupported keys are not read at all and not in it).
+        """
+        groups = {}
+        for call_type, addr in keys:
+            if (call_type, addr) not in self.unsupported:
+                groups.setdefault(call_type, []).append(addr)
+        excluded = {}
+        for call_type, addr in self.unsupported:
+            excluded.setdefault(call_type, set()).add(addr)
+        blocks = [
+            block
+            for call_type, addresses in sorted(groups.items())
+            for block in optimal_blocks(
+                call_type, addresses, *self._plan_costs, exclude=excluded.get(call_type, frozenset())
+            )
+        ]
+        wanted = set(keys)
+        period = 1 / rate
+        async with self._poll_lock:
+            _LOGGER.info("Systemair %s: Burst of %d blocks at %s Hz for %ss", self.slave, len(blocks), rate, duration)
+            next_at = time.monotonic()
+            end = next_at + duration
+            while (started := time.monotonic()) < end:
+                failed = {
+                    (block.call_type, addr)
+                    for block in blocks
+                    if await self._async_read_block(block) != READ_OK
+                    for addr in range(block.start, block.end + 1)
+                } & wanted
+                await on_sample(time.monotonic() - started, failed)
+                # When a read overruns the period, carry on from now instead of catching up
+                next_at = max(next_at + period, time.monotonic())
+                await asyncio.sleep(next_at - time.monotonic())
+        _LOGGER.info("Systemair %s: Burst done, back to normal polling", self.slave)
+
+    async def async_read_back(self, keys) -> bool:
+        """Read the given (call_type, address) registers now, in as few requests as possible."""
+        groups = {}
+        for call_type, addr in keys:
+            groups.setdefault(call_type, []).append(addr)
+        statuses = [
+            await self._async_read_block(block)
+            for call_type, addresses in groups.items()
+            for block in optimal_blocks(call_type, addresses, *self._plan_costs)
+        ]
+        self.async_update_listeners()
+        return all(status == READ_OK for status in statuses)
+
+    def _tier_period(self, tier):
+        """How often a tier is refreshed, in seconds."""
+        interval = self.update_interval.total_seconds()
+        if tier == TIER_CONFIG:
+            return interval * max(1, len(self._config_slices))
+        if tier == TIER_SLOW:
+            return RESYNC_INTERVAL
+        return interval
+
+    def overdue(self) -> dict:
+        """entity_id -> age (s) of its oldest value, for entities with values overdue.
+
+        Overdue means older than STALE_FACTOR refresh periods of the entity's
+        tier; the age is None for values that were never read. Registers the unit
+        does not support are left out.
+        """
+        now = time.monotonic()
+        result = {}
+        for owner, groups in self._owners.items():
+            worst = 0.0
+            for tier, keys in groups:
+                limit = STALE_FACTOR * self._tier_period(tier)
+                for key in keys:
+                    if key in self.unsupported:
+                        continue
+                    read_at = self._read_at.get(key[1])
+                    age = math.inf if read_at is None else now - read_at
+                    if age > limit:
+                        worst = max(worst, age)
+            if worst:
+                result[owner] = None if worst == math.inf else round(worst)
+        return result
+
+    @callback
+    def async_update_listeners(self):
+        """Decode the operating state once, then let the entities render it."""
+        with self.profiler.span("decode", self.label):
+            self.state = decode_state(self.registers)
+        with self.profiler.span("render", self.label):
+            super().async_update_listeners()
+        if self._poll_done:
+            self._poll_done = False
+            self._async_fire_snapshot()
+
+    @callback
+    def async_collect(self, entity_id, state):
+        """Note an entity's rendered state for the next snapshot event."""
+        if entity_id in self._published and self._published[entity_id] == state:
+            # Changed and back again since the last event
+            self._changed.pop(entity_id, None)
+        else:
+            self._changed[entity_id] = state
+
+    @callback
+    def _async_fire_snapshot(self):
+        if not self._changed:
+            return
+        changed, self._changed = self._changed, {}
+        self._published.update(changed)
+        self.hass.bus.async_fire(
+            EVENT_SNAPSHOT,
+            {"entry_id": self.entry_id, "slave": self.slave, "changed": changed},
+        )
+
+    def read_age(self, address):
+        """Seconds since `address` was last confirmed by a read or write, None if never."""
+        read_at = self._read_at.get(address)
+        return None if read_at is None else time.monotonic() - read_at
+
+    def cached(self, call_type, address, count, max_age=0):
+        """The snapshot values of `count` registers from `address`, as the local proxy serves them.
+
+        Returns (READ_OK, values), (READ_REJECTED, None) if a register is not in
+        the poll plan, or (READ_FAILED, None) if one is older than `max_age`
+        seconds (0: STALE_FACTOR refresh periods of its tier) or was never read.
+        """
+        now = time.monotonic()
+        values = []
+        for addr in range(address, address + count):
+            tier = self._planned.get((call_type, addr))
+            if tier is None:
+                return READ_REJECTED, None
+            read_at = self._read_at.get(addr)
+            if read_at is None or now - read_at > (max_age or STALE_FACTOR * self._tier_period(tier)):
+                return READ_FAILED, None
+            values.append(self.registers[addr])
+        return READ_OK, values
+
+    def is_current(self, address, value) -> bool:
+        """True if the snapshot holds `value` for `address` and is fresh enough to trust.
+
+        Fresh enough means confirmed within two poll intervals; config registers
+        the sweep has not reached lately are never treated as current.
+        """
+        read_at = self._read_at.get(address)
+        if read_at is None or address in self._unconfirmed or self.registers.get(address) != value & 0xFFFF:
+            return False
+        return time.monotonic() - read_at <= 2 * self.update_interval.total_seconds()
+
+    async def async_write_register(self, address, value, force=False) -> bool:
+        """Write one register (FC06) and mirror it into the snapshot.
+
+        The write is skipped (and reported as done) when the unit already holds
+        the value, unless `force` is set. Writes to the same register inside the
+        write window are coalesced: the first call opens the window, later calls
+        only replace the value, and everyone gets the result of the single write
+        of the last value.
+        """
+        if not force and address not in self._pending_writes and self.is_current(address, value):
+            _LOGGER.debug("Systemair %s: %s already holds %s, not writing", self.slave, address, value)
+            return True
+
+        if self._write_window <= 0:
+            return await self._async_write_now(address, value)
+
+        if (pending := self._pending_writes.get(address)) is not None:
+            pending[0] = value
+        else:
+            pending = self._pending_writes[address] = [value, self.hass.loop.create_future()]
+            self.hass.async_create_task(self._async_flush_write(address))
+        # shield: one caller being cancelled must not cancel the shared write
+        return await asyncio.shield(pending[1])
+
+    async def _async_flush_write(self, address):
+        with self.profiler.span("sleep", self.label):
+            await asyncio.sleep(self._write_window)
+        value, future = self._pending_writes.pop(address)
+        try:
+            result = await self._async_write_now(address, value)
+        except Exception as e:
+            _LOGGER.error("Systemair %s: Write of %s to %s failed: %s", self.slave, value, address, e)
+            result = False
+        future.set_result(result)
+
+    async def _async_write_now(self, address, value) -> bool:
+        with self.profiler.span("write", self.label):
+            ok = await self._async_call(address, value, CALL_TYPE_WRITE_REGISTER)
+        if not ok:
+            return False
+        self.registers[address] = value & 0xFFFF
+        self._read_at[address] = time.monotonic()
+        self.async_update_listeners()
+        return True
+
+    async def async_write_registers(self, address, values, force=False) -> bool:
+        """Write consecutive registers in one request (FC16) and mirror them."""
+        if not force and all(self.is_current(address + i, v) for i, v in enumerate(values)):
+            return True
+        with self.profiler.span("write", self.label):
+            ok = await self._async_call(address, values, CALL_TYPE_WRITE_REGISTERS)
+        if not ok:
+            return False
+        now = time.monotonic()
+        for offset, value in enumerate(values):
+            self.registers[address + offset] = value & 0xFFFF
+            self._read_at[address + offset] = now
+        self.async_update_listeners()
+        return True
+
+    async def async_set_user_mode(self, mode_val, speed_val=None, force=False) -> bool:
+        """Switch user mode (1161) and, for manual modes, the fan speed (1130).
+
+        Parts the unit is already in are skipped, and so is the pause between
+        the two writes, unless `force` is set.
+        """
+        mode_done = not force and self.is_current(REG_USER_MODE, mode_val - 1)
+        if not mode_done:
+            # 1161 is a command register and never read back, so always write it
+            if not await self.async_write_register(REG_USER_MODE_CMD, mode_val, force=True):
+                return False
+            # Show the new mode straight away; it is not trusted as read until the next poll
+            self.registers[REG_USER_MODE] = mode_val - 1
+            # Its last read stays the age overdue() sees; is_current() waits for the next one
+            self._unconfirmed.add(REG_USER_MODE)
+            self._slow_due = 0.0
+            self.async_update_listeners()
+        if speed_val is None:
+            return True
+        if not mode_done:
+            with self.profiler.span("sleep", self.label):
+                await asyncio.sleep(MODE_SPEED_DELAY)
+        return await self.async_write_register(REG_FAN_LEVEL, speed_val, force=force)
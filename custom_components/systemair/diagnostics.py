@@ -0,0 +1,23 @@
+"""Diagnostics: connection settings, poll plan health and the last profiling result."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+from .const import DOMAIN
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(hass, entry):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "options": dict(entry.options),
+        "poll": {
+            "last_poll_s": round(coordinator.last_poll, 3),
+            "carried_over": coordinator.carried_over,
+            "overdue": coordinator.overdue(),
+            "unsupported": sorted(f"{call_type}:{addr}" for call_type, addr in coordinator.unsupported),
+        },
+        "plan": coordinator.plan_info(),
+        # Summary of the last `systemair.profile` run this unit took part in
+        "profile": coordinator.last_profile,
+    }
@@ -0,0 +1,60 @@
+"""Find Systemair units on a Modbus line by probing a range of slave IDs."""
+import asyncio
+import math
+import time
+
+from homeassistant.components.modbus.const import CALL_TYPE_REGISTER_INPUT
+from .const import DEFAULT_SCAN_INTERVAL
+from .state import REG_USER_MODE
+
+# Probe timeout for the direct transports; silent IDs cost this much each
+DISCOVERY_TIMEOUT = 0.5        # s
+# Reads per found unit to measure its round-trip time (the fastest one counts)
+LATENCY_SAMPLES = 3
+# Rough number of requests one unit costs per poll (live blocks and a config slice)
+REQUESTS_PER_POLL = 8
+# Share of the bus the suggested scan interval leaves the polling at most
+BUS_SHARE = 0.25
+
+
+async def _async_probe(client, slave) -> bool:
+    # 1160 (user mode) exists on every SAVE unit and is a single register
+    result = await client.async_pb_call(slave, REG_USER_MODE, 1, CALL_TYPE_REGISTER_INPUT)
+    return bool(result and hasattr(result, 'registers'))
+
+
+async def async_discover(client, slaves, concurrent=True) -> dict:
+    """Probe `slaves` and time the units that answer.
+
+    Returns slave -> round-trip time in seconds. With `concurrent` the probes
+    are sent together and the client (set up with a short timeout) spreads them
+    over its connections. A Modbus hub or a client already in use serializes
+    requests anyway; there they go one at a time, each with the client's own
+    timeout, since cancelling a request mid-flight can desync an RTU line.
+    Round-trip times are measured one unit at a time afterwards so queueing
+    behind other probes does not count.
+    """
+    slaves = list(slaves)
+    if concurrent:
+        answered = await asyncio.gather(*(_async_probe(client, slave) for slave in slaves))
+    else:
+        answered = [await _async_probe(client, slave) for slave in slaves]
+
+    found = {}
+    for slave, ok in zip(slaves, answered):
+        if not ok:
+            continue
+        samples = []
+        for _ in range(LATENCY_SAMPLES):
+            started = time.monotonic()
+            if await _async_probe(client, slave):
+                samples.append(time.monotonic() - started)
+        if samples:
+            found[slave] = min(samples)
+    return found
+
+
+def suggest_scan_interval(latencies) -> int:
+    """Poll interval (s) that keeps polling of all units below BUS_SHARE of the line."""
+    busy = sum(latencies) * REQUESTS_PER_POLL
+    return max(DEFAULT_SCAN_INTERVAL, math.ceil(busy / BUS_SHARE))
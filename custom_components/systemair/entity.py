@@ -0,0 +1,76 @@
+"""Base entity and description for everything rendered from the register snapshot."""
+from dataclasses import dataclass, replace
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityCategory, EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from .const import CONF_PROFILE, PROFILE_LEAN, LEAN_OPTIONAL, TIER_LIVE, TIER_CONFIG
+
+
+def signed(val):
+    """uint16 register value to int16."""
+    return val - 65536 if val is not None and val > 32767 else val
+
+
+@dataclass(frozen=True, kw_only=True)
+class SystemairEntityDescription(EntityDescription):
+    """Fields shared by all Systemair descriptions."""
+    # ((call_type, (address, ...)), ...) the entity reads from the snapshot
+    registers: tuple = ()
+    # Overrides the tier derived from the entity category
+    poll_tier: str | None = None
+
+
+def apply_profile(entry, descriptions):
+    """Return the descriptions with lean-profile entities disabled by default."""
+    profile = entry.options.get(CONF_PROFILE, entry.data.get(CONF_PROFILE))
+    if profile != PROFILE_LEAN:
+        return descriptions
+    return [
+        replace(d, entity_registry_enabled_default=False) if d.key in LEAN_OPTIONAL else d
+        for d in descriptions
+    ]
+
+
+class SystemairEntity(CoordinatorEntity):
+    """Tracks its registers with the coordinator while added and renders on each update.
+
+    What an entity reads comes from `entity_description.registers` (or an
+    override of `_tracked_registers`); subclasses set their state in
+    `_update_from_snapshot`.
+    """
+
+    _attr_has_entity_name = True
+    # None: config tier for EntityCategory.CONFIG entities, live otherwise
+    _poll_tier = None
+
+    def __init__(self, coordinator, description=None):
+        super().__init__(coordinator)
+        if description is not None:
+            self.entity_description = description
+        self._attr_device_info = coordinator.device_info
+
+    def _tracked_registers(self):
+        """Iterable of (call_type, addresses) this entity reads."""
+        description = getattr(self, "entity_description", None)
+        return description.registers if isinstance(description, SystemairEntityDescription) else ()
+
+    def _update_from_snapshot(self):
+        """Set the entity state from coordinator.registers."""
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        tier = (
+            self._poll_tier
+            or getattr(getattr(self, "entity_description", None), "poll_tier", None)
+            or (TIER_CONFIG if self.entity_category == EntityCategory.CONFIG else TIER_LIVE)
+        )
+        for call_type, addresses in self._tracked_registers():
+            self.async_on_remove(self.coordinator.async_track(call_type, addresses, tier, self.entity_id))
+        self._update_from_snapshot()
+
+    @callback
+    def _handle_coordinator_update(self):
+        self._update_from_snapshot()
+        self.async_write_ha_state()
+        if self.coordinator.snapshot_event:
+            self.coordinator.async_collect(self.entity_id, self.state)
@@ -1,12 +1,10 @@
 import logging
-from homeassistant.components.number import NumberEntity, NumberMode
+from dataclasses import dataclass
+from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.const import CONF_MODEL
-from homeassistant.components.modbus.const import (
-    CALL_TYPE_WRITE_REGISTER, 
-    CALL_TYPE_REGISTER_HOLDING
-)
-from .const import DOMAIN, CONF_SLAVE
+from homeassistant.components.modbus.const import CALL_TYPE_REGISTER_HOLDING
+from .const import DOMAIN
+from .entity import SystemairEntity, SystemairEntityDescription, apply_profile, signed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,75 +71,60 @@ SYSTEMAIR_NUMBERS = [
     ("sched_inactive_offset", 5001, -10.0, 0.0, 0.5, "°C", 10, "mdi:sun-thermometer", EntityCategory.CONFIG), 
 ]
 
+@dataclass(frozen=True, kw_only=True)
+class SystemairNumberEntityDescription(SystemairEntityDescription, NumberEntityDescription):
+    register: int
+    scale: int = 1
+
+NUMBER_DESCRIPTIONS = tuple(
+    SystemairNumberEntityDescription(
+        key=key,
+        translation_key=key,
+        register=register,
+        registers=((CALL_TYPE_REGISTER_HOLDING, (register,)),),
+        native_min_value=min_val,
+        native_max_value=max_val,
+        native_step=step,
+        native_unit_of_measurement=unit,
+        scale=scale,
+        icon=icon,
+        entity_category=category,
+        mode=NumberMode.BOX,
+    )
+    for key, register, min_val, max_val, step, unit, scale, icon, category in SYSTEMAIR_NUMBERS
+)
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up SystemAir numbers from a config entry."""
-    config = entry.data
-    from homeassistant.components.modbus import get_hub
-    hub = get_hub(hass, config.get("hub_name", "modbus_hub"))
-    
-    if hub is None:
-        _LOGGER.error("SystemAir: Modbus hub not found for numbers")
-        return
-
-    model = config.get(CONF_MODEL, "SAVE")
-    slave = config.get(CONF_SLAVE, 1)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities([SystemAirNumber(hub, model, slave, *s) for s in SYSTEMAIR_NUMBERS], True)
+    async_add_entities([
+        SystemAirNumber(coordinator, d) for d in apply_profile(entry, NUMBER_DESCRIPTIONS)
+    ])
 
-class SystemAirNumber(NumberEntity):
+class SystemAirNumber(SystemairEntity, NumberEntity):
     """Representation of a Systemair Modbus number entity."""
-    _attr_has_entity_name = True
-    _attr_mode = NumberMode.BOX
-
-    def __init__(self, hub, model, slave, translation_key, register, min_val, max_val, step, unit, scale, icon, category):
-        self._hub = hub
-        self._slave = slave
-        self._model = model
-        self._register = register
-        self._scale = scale
-        
-        self._attr_translation_key = translation_key
-        self._attr_native_min_value = min_val
-        self._attr_native_max_value = max_val
-        self._attr_native_step = step
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_entity_category = category
-        self._attr_unique_id = f"{DOMAIN}_{slave}_num_{register}_{translation_key}"
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, f"{self._model}_{self._slave}")},
-            "name": f"Systemair {self._model}",
-            "manufacturer": "Systemair",
-            "model": f"SAVE {self._model}",
-        }
+    entity_description: SystemairNumberEntityDescription
+
+    def __init__(self, coordinator, description):
+        super().__init__(coordinator, description)
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slave}_num_{description.register}_{description.key}"
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value on Modbus."""
         try:
-            modbus_val = int(value * self._scale)
+            modbus_val = int(value * self.entity_description.scale)
             # Handle signed integers (2's complement)
             if modbus_val < 0:
                 modbus_val += 65536
             
-            result = await self._hub.async_pb_call(self._slave, self._register, modbus_val, CALL_TYPE_WRITE_REGISTER)
-            if result:
-                self._attr_native_value = value
-                self.async_write_ha_state()
-        except Exception as e:
-            _LOGGER.error("SystemAir: Set failed for %s: %s", self._attr_translation_key, e)
-
-    async def async_update(self):
-        """Fetch new state data for the entity."""
-        try:
-            res = await self._hub.async_pb_call(self._slave, self._register, 1, CALL_TYPE_REGISTER_HOLDING)
-            if res and hasattr(res, 'registers'):
-                val = res.registers[0]
-                # Handle signed integers
-                if val > 32767:
-                    val -= 65536
-                self._attr_native_value = float(val) / self._scale
+            await self.coordinator.async_write_register(self.entity_description.register, modbus_val)
         except Exception as e:
-            _LOGGER.error("SystemAir: Update failed for %s: %s", self._attr_translation_key, e)
\ No newline at end of file
+            _LOGGER.error("SystemAir: Set failed for %s: %s", self.entity_description.key, e)
+
+    def _update_from_snapshot(self):
+        """Decode the register from the snapshot."""
+        val = self.coordinator.registers.get(self.entity_description.register)
+        if val is not None:
+            # Handle signed integers
+            self._attr_native_value = float(signed(val)) / self.entity_description.scale
@@ -0,0 +1,139 @@
+"""Read planning: merge the tracked registers into block reads and slice them by bus time."""
+from typing import NamedTuple
+
+# Registers per read request. Modbus allows 125, some gateways choke above ~100.
+MAX_BLOCK = 100
+
+# Bus cost estimate until CostModel has learned the line: fixed cost per
+# request (framing, turnaround, gateway) plus a cost per register read.
+# Defaults are roughly an RS-485 line at 9600 baud behind a TCP gateway.
+DEFAULT_REQUEST_COST = 0.05     # s
+DEFAULT_REGISTER_COST = 0.0025  # s
+
+
+class Block(NamedTuple):
+    """One read request: `count` registers of `call_type` starting at `start`."""
+    call_type: str
+    start: int
+    count: int
+
+    @property
+    def end(self):
+        return self.start + self.count - 1
+
+
+def estimate(block, request_cost=DEFAULT_REQUEST_COST, register_cost=DEFAULT_REGISTER_COST):
+    """Predicted bus time of one block read in seconds."""
+    return request_cost + block.count * register_cost
+
+
+def slice_blocks(blocks, budget, request_cost=DEFAULT_REQUEST_COST, register_cost=DEFAULT_REGISTER_COST):
+    """Pack blocks into slices whose predicted bus time stays within `budget` seconds.
+
+    Blocks that alone exceed the budget are cut into smaller reads first, so every
+    slice costs about the same. Every slice holds at least one block.
+    """
+    per_block = max(1, int((budget - request_cost) / register_cost))
+    pieces = []
+    for block in blocks:
+        for offset in range(0, block.count, per_block):
+            pieces.append(Block(block.call_type, block.start + offset, min(per_block, block.count - offset)))
+
+    slices = []
+    current, cost = [], 0.0
+    for block in pieces:
+        block_cost = estimate(block, request_cost, register_cost)
+        if current and cost + block_cost > budget:
+            slices.append(current)
+            current, cost = [], 0.0
+        current.append(block)
+        cost += block_cost
+    if current:
+        slices.append(current)
+    return slices
+
+
+def optimal_blocks(call_type, addresses, request_cost, register_cost, max_count=MAX_BLOCK, exclude=frozenset()):
+    """Blocks covering `addresses` at the lowest predicted bus time.
+
+    Reading through a gap costs `register_cost` per unused register, splitting
+    costs another request; this picks the cheapest split of the whole list
+    (dynamic programming), within `max_count` and never across `exclude`.
+    """
+    addrs = sorted(set(addresses))
+    # best[i]: (cost, start index of the last block) of the cheapest cover of addrs[:i]
+    best = [(0.0, 0)]
+    for i, last in enumerate(addrs):
+        choice = None
+        for j in range(i, -1, -1):
+            if last - addrs[j] >= max_count or (
+                j < i and any(a in exclude for a in range(addrs[j] + 1, addrs[j + 1]))
+            ):
+                break
+            cost = best[j][0] + request_cost + (last - addrs[j] + 1) * register_cost
+            if choice is None or cost < choice[0]:
+                choice = (cost, j)
+        best.append(choice)
+
+    blocks = []
+    end = len(addrs)
+    while end:
+        start = best[end][1]
+        blocks.append(Block(call_type, addrs[start], addrs[end - 1] - addrs[start] + 1))
+        end = start
+    return blocks[::-1]
+
+
+# Learning the bus costs: the defaults enter as reads of 1 and MAX_BLOCK
+# registers with this weight; they decay like real reads and fade out
+PRIOR_WEIGHT = 0.5
+# Per-read decay of older reads, so the fit follows a line that changes
+COST_DECAY = 0.99
+# Variance of the read sizes (registers²) below which the slope is not
+# trusted; only the request cost is fitted then
+MIN_SPREAD = 0.25
+# Floors so a lucky streak of fast reads cannot make anything look free
+MIN_REQUEST_COST = 0.001        # s
+MIN_REGISTER_COST = 0.00001     # s
+
+
+class CostModel:
+    """Learns the request and register cost of one line from timed reads.
+
+    Fits time = request_cost + registers * register_cost by exponentially
+    weighted least squares over the successful reads seen so far.
+    """
+
+    def __init__(self, request_cost=DEFAULT_REQUEST_COST, register_cost=DEFAULT_REGISTER_COST):
+        self.request_cost = request_cost
+        self.register_cost = register_cost
+        self.samples = 0
+        # weight, sum x, sum y, sum xx, sum xy (x: registers, y: seconds)
+        self._sums = [0.0] * 5
+        for count in (1, MAX_BLOCK):
+            self._add(count, request_cost + count * register_cost, PRIOR_WEIGHT)
+
+    def _add(self, count, duration, weight):
+        sums = self._sums
+        sums[0] += weight
+        sums[1] += weight * count
+        sums[2] += weight * duration
+        sums[3] += weight * count * count
+        sums[4] += weight * count * duration
+
+    def add(self, count, duration):
+        """Learn from one read of `count` registers that took `duration` seconds."""
+        self._sums = [value * COST_DECAY for value in self._sums]
+        self._add(count, duration, 1)
+        self.samples += 1
+
+        w, x, y, xx, xy = self._sums
+        spread = w * xx - x * x
+        if spread > MIN_SPREAD * w * w:
+            self.register_cost = max(MIN_REGISTER_COST, (w * xy - x * y) / spread)
+        self.request_cost = max(MIN_REQUEST_COST, (y - self.register_cost * x) / w)
+
+    @property
+    def costs(self):
+        """(request_cost, register_cost) in seconds."""
+        return self.request_cost, self.register_cost
@@ -0,0 +1,135 @@
+"""On-demand profiling of the poll and write paths.
+
+While a session runs, the coordinators and direct clients it is attached to
+time each phase in spans, and a background thread samples the event loop's
+call stack. Outside a session everything talks to NULL_PROFILER, whose spans
+cost next to nothing.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+# Span names:
+#   poll       one whole poll of a unit
+#   bus        one Modbus request as the coordinator sees it (queue + transport)
+#   queue      waiting for a free connection (direct transport only)
+#   transport  the request on the connection, pacing included (direct transport only)
+#   decode     copying a response into the snapshot / decoding the operating state
+#   render     entities rendering the snapshot and writing their state
+#   write      one write request
+#   sleep      deliberate pauses (write window, mode -> speed delay)
+
+# Raw spans kept for the file; the summary counts all of them
+MAX_EVENTS = 200_000
+SAMPLE_INTERVAL = 0.01     # s
+MAX_STACK_DEPTH = 60
+
+
+class _NullProfiler:
+    active = False
+    _null = nullcontext()
+
+    def span(self, name, owner):
+        return self._null
+
+
+NULL_PROFILER = _NullProfiler()
+
+
+class _Sampler(threading.Thread):
+    """Samples the call stack of one thread, counting collapsed stacks."""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name="systemair_profiler", daemon=True)
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self.counts = Counter()
+
+    def run(self):
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class ProfileSession:
+    """One bounded profiling window. Create it in the event loop thread."""
+
+    active = True
+
+    def __init__(self, sampling):
+        self.started = time.time()
+        self._t0 = time.perf_counter()
+        self._stats = {}    # (owner, name) -> [count, total, max]
+        self.events = []    # (offset s, owner, name, duration s)
+        self._sampler = _Sampler(threading.get_ident(), SAMPLE_INTERVAL) if sampling else None
+        if self._sampler:
+            self._sampler.start()
+
+    @contextmanager
+    def span(self, name, owner):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            stats = self._stats.setdefault((owner, name), [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+            if len(self.events) < MAX_EVENTS:
+                self.events.append((round(start - self._t0, 6), owner, name, round(duration, 6)))
+
+    def stop(self):
+        if self._sampler:
+            self._sampler.stop()
+        self.duration = time.perf_counter() - self._t0
+
+    def summary(self, owner=None) -> dict:
+        """Per span name: count, total, mean and max in ms (for one owner or per owner)."""
+        def stats(count, total, longest):
+            return {
+                "count": count,
+                "total_ms": round(total * 1000, 1),
+                "mean_ms": round(total / count * 1000, 2),
+                "max_ms": round(longest * 1000, 2),
+            }
+
+        if owner is not None:
+            return {name: stats(*s) for (o, name), s in sorted(self._stats.items()) if o == owner}
+        result = {}
+        for (o, name), s in sorted(self._stats.items()):
+            result.setdefault(o, {})[name] = stats(*s)
+        return result
+
+    def top_stacks(self, limit=20):
+        if not self._sampler:
+            return []
+        return [{"stack": stack, "samples": n} for stack, n in self._sampler.counts.most_common(limit)]
+
+    def write(self, path):
+        """Write the full result as JSON (blocking, run it in the executor)."""
+        data = {
+            "started": self.started,
+            "duration_s": round(self.duration, 3),
+            "summary": self.summary(),
+            "spans": self.events,
+            # Collapsed stacks ("a;b;c": count), e.g. for flamegraph tools
+            "samples": dict(self._sampler.counts) if self._sampler else {},
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
@@ -0,0 +1,172 @@
+"""Local Modbus TCP server answering other Modbus clients from the units' snapshots.
+
+Loggers and commissioning tools that want the same data as Home Assistant read
+it here instead of adding their own requests to the bus. Reads are served from
+the coordinator's snapshot when the values are fresh enough; they never reach
+the bus. Writes go through the coordinator's write path (coalescing, skipping
+values the unit already holds). The MBAP unit id selects the unit by slave ID;
+units with the same proxy port share one server.
+"""
+import asyncio
+import logging
+import struct
+
+from homeassistant.components.modbus.const import (
+    CALL_TYPE_REGISTER_HOLDING,
+    CALL_TYPE_REGISTER_INPUT,
+)
+from .const import DOMAIN, ILLEGAL_DATA_ADDRESS
+from .coordinator import READ_OK, READ_REJECTED, REG_USER_MODE_CMD
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data[DOMAIN] key for the running servers (port -> ModbusProxy)
+DATA_PROXIES = "proxies"
+
+_MBAP = struct.Struct(">HHHB")     # transaction id, protocol id, length, unit id
+
+FC_READ_HOLDING = 3
+FC_READ_INPUT = 4
+FC_WRITE_REGISTER = 6
+FC_WRITE_REGISTERS = 16
+
+_READS = {
+    FC_READ_HOLDING: CALL_TYPE_REGISTER_HOLDING,
+    FC_READ_INPUT: CALL_TYPE_REGISTER_INPUT,
+}
+
+# Modbus exception codes
+EXC_ILLEGAL_FUNCTION = 1
+EXC_ILLEGAL_VALUE = 3
+EXC_DEVICE_FAILURE = 4
+EXC_DEVICE_BUSY = 6            # value too old: the client should retry later
+EXC_GATEWAY_NO_RESPONSE = 11   # no unit with that id behind this server
+
+# Register counts the protocol allows per request
+MAX_READ = 125
+MAX_WRITE = 123
+
+
+def _exception(function, code):
+    return bytes((function | 0x80, code))
+
+
+class ModbusProxy:
+    """One Modbus TCP server for every unit set up with its port."""
+
+    def __init__(self, port):
+        self.port = port
+        # unit id -> (coordinator, max age in s)
+        self.units = {}
+        self._server = None
+        self._clients = set()
+
+    async def async_start(self):
+        # All interfaces: the consumers usually run on other machines
+        self._server = await asyncio.start_server(self._async_handle_client, port=self.port)
+        _LOGGER.info("Systemair: Modbus proxy listening on port %s", self.port)
+
+    async def async_stop(self):
+        self._server.close()
+        # wait_closed also waits for open client connections
+        for writer in list(self._clients):
+            writer.close()
+        await self._server.wait_closed()
+
+    async def _async_handle_client(self, reader, writer):
+        self._clients.add(writer)
+        try:
+            while True:
+                transaction, protocol, length, unit_id = _MBAP.unpack(await reader.readexactly(_MBAP.size))
+                if not 2 <= length <= 254:
+                    # Not Modbus TCP, or out of step with the stream
+                    break
+                pdu = await reader.readexactly(length - 1)
+                if protocol != 0:
+                    continue
+                response = await self._async_answer(unit_id, pdu)
+                writer.write(_MBAP.pack(transaction, 0, len(response) + 1, unit_id) + response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _async_answer(self, unit_id, pdu) -> bytes:
+        function = pdu[0]
+        if unit_id not in self.units:
+            return _exception(function, EXC_GATEWAY_NO_RESPONSE)
+        coordinator, max_age = self.units[unit_id]
+        try:
+            if function in _READS:
+                address, count = struct.unpack_from(">HH", pdu, 1)
+                if not 1 <= count <= MAX_READ:
+                    return _exception(function, EXC_ILLEGAL_VALUE)
+                status, values = coordinator.cached(_READS[function], address, count, max_age)
+                if status == READ_REJECTED:
+                    return _exception(function, ILLEGAL_DATA_ADDRESS)
+                if status != READ_OK:
+                    return _exception(function, EXC_DEVICE_BUSY)
+                return struct.pack(f">BB{count}H", function, 2 * count, *values)
+
+            if function == FC_WRITE_REGISTER:
+                address, value = struct.unpack_from(">HH", pdu, 1)
+                ok = await self._async_write(coordinator, address, [value])
+                return pdu[:5] if ok else _exception(function, EXC_DEVICE_FAILURE)
+
+            if function == FC_WRITE_REGISTERS:
+                address, count, size = struct.unpack_from(">HHB", pdu, 1)
+                if not 1 <= count <= MAX_WRITE or size != 2 * count:
+                    return _exception(function, EXC_ILLEGAL_VALUE)
+                values = list(struct.unpack_from(f">{count}H", pdu, 6))
+                ok = await self._async_write(coordinator, address, values)
+                return pdu[:5] if ok else _exception(function, EXC_DEVICE_FAILURE)
+        except struct.error:
+            return _exception(function, EXC_ILLEGAL_VALUE)
+        return _exception(function, EXC_ILLEGAL_FUNCTION)
+
+    @staticmethod
+    async def _async_write(coordinator, address, values) -> bool:
+        _LOGGER.debug("Systemair %s: Proxy write of %s to %s", coordinator.slave, values, address)
+        if address == REG_USER_MODE_CMD and len(values) == 1:
+            # Keeps the snapshot's user mode in step, like the select does
+            return await coordinator.async_set_user_mode(values[0])
+        if len(values) == 1:
+            return await coordinator.async_write_register(address, values[0])
+        return await coordinator.async_write_registers(address, values)
+
+
+async def async_attach_proxy(hass, port, coordinator, max_age):
+    """Serve a unit on the proxy at `port`, starting the server for the first unit."""
+    pool = hass.data[DOMAIN].setdefault(DATA_PROXIES, {})
+    if (proxy := pool.get(port)) is None:
+        proxy = ModbusProxy(port)
+        try:
+            await proxy.async_start()
+        except OSError as err:
+            _LOGGER.error("Systemair: Cannot start the Modbus proxy on port %s: %s", port, err)
+            return
+        pool[port] = proxy
+    if coordinator.slave in proxy.units:
+        _LOGGER.warning(
+            "Systemair: Unit id %s is already served on proxy port %s, not adding %s",
+            coordinator.slave, port, coordinator.label,
+        )
+        return
+    proxy.units[coordinator.slave] = (coordinator, max_age)
+    # The options may change before the unit is unloaded; detach from this port
+    coordinator.proxy_port = port
+
+
+async def async_detach_proxy(hass, coordinator):
+    """Stop serving a unit, closing the server with the last one."""
+    port, coordinator.proxy_port = coordinator.proxy_port, None
+    pool = hass.data[DOMAIN].get(DATA_PROXIES, {})
+    if port is None or (proxy := pool.get(port)) is None:
+        return
+    if proxy.units.get(coordinator.slave, (None,))[0] is coordinator:
+        del proxy.units[coordinator.slave]
+    if not proxy.units:
+        pool.pop(port)
+        await proxy.async_stop()
@@ -1,20 +1,25 @@
-import asyncio
 import logging
+from dataclasses import dataclass
+from datetime import timedelta
 from homeassistant.components.sensor import (
     SensorEntity, 
+    SensorEntityDescription,
     SensorDeviceClass, 
     SensorStateClass
 )
 from homeassistant.const import (
     UnitOfTemperature, 
     UnitOfPower,
-    CONF_MODEL
 )
 from homeassistant.components.modbus.const import (
     CALL_TYPE_REGISTER_HOLDING,
     CALL_TYPE_REGISTER_INPUT
 )
-from .const import DOMAIN, CONF_SLAVE
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.event import async_track_time_interval
+from .const import DOMAIN, TIER_SLOW
+from .entity import SystemairEntity, SystemairEntityDescription, signed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,123 +59,152 @@ SYSTEMAIR_SENSORS = [
     ("manual_fan_reg", 1130, None, None, 1.0, "mdi:cog-clockwise", None),
 ]
 
-async def async_setup_entry(hass, entry, async_add_entities):
-    config = entry.data
-    from homeassistant.components.modbus import get_hub
-    hub = get_hub(hass, config.get("hub_name", "modbus_hub"))
-    
-    if hub is None:
-        _LOGGER.error("Systemair: Modbus hub not found for sensors")
-        return
-
-    model = config.get(CONF_MODEL, "SAVE")
-    slave = config.get(CONF_SLAVE, 1)
-    entities = [SystemairSensor(hub, model, slave, *s) for s in SYSTEMAIR_SENSORS]
-    async_add_entities(entities, True)
-
-class SystemairSensor(SensorEntity):
-    _attr_has_entity_name = True
-
-    def __init__(self, hub, model, slave, translation_key, register, device_class, unit, scale, icon, state_class=None):
-        self._hub = hub
-        self._slave = slave
-        self._model = model
-        self._register = register
-        self._scale = scale
-        
-        self._attr_translation_key = translation_key
-        self._attr_device_class = device_class
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_state_class = state_class
-        self._attr_unique_id = f"{DOMAIN}_{slave}_sensor_{register}_{translation_key}"
-        self._state = None
-
-    @property
-    def device_info(self):
-        """Link sensors to the device UI."""
-        return {
-            "identifiers": {(DOMAIN, f"{self._model}_{self._slave}")},
-            "name": f"Systemair {self._model}",
-            "manufacturer": "Systemair",
-            "model": f"SAVE {self._model}",
-        }
+# Input registers read as unsigned; everything else in 12000-16000 is int16
+UNSIGNED_INPUTS = [12400, 12401, 12135, 14000, 14001, 14102]
+
+# 32-bit second counters the unit counts down in real time (high -> low word).
+# They are read on the slow tier and counted down locally in between.
+COUNTDOWNS = {1111: 1110, 7005: 7004}
+COUNTDOWN_TICK = timedelta(seconds=30)
+
+@dataclass(frozen=True, kw_only=True)
+class SystemairSensorEntityDescription(SystemairEntityDescription, SensorEntityDescription):
+    register: int
+    scale: float = 1.0
+
+def _sensor_registers(register):
+    """What a sensor reads; a few combine several registers."""
+    if register == 1160:
+        return ((CALL_TYPE_REGISTER_INPUT, (1160,)), (CALL_TYPE_REGISTER_HOLDING, (1130,)))
+    if register == 1111:
+        return ((CALL_TYPE_REGISTER_INPUT, (COUNTDOWNS[1111], 1111)),)
+    if register == 7005:
+        return ((CALL_TYPE_REGISTER_HOLDING, (COUNTDOWNS[7005], 7005)),)
+    is_input = (12000 <= register <= 16000)
+    return ((CALL_TYPE_REGISTER_INPUT if is_input else CALL_TYPE_REGISTER_HOLDING, (register,)),)
+
+SENSOR_DESCRIPTIONS = tuple(
+    SystemairSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        register=register,
+        registers=_sensor_registers(register),
+        poll_tier=TIER_SLOW if register in COUNTDOWNS else None,
+        device_class=device_class,
+        native_unit_of_measurement=unit,
+        scale=scale,
+        icon=icon,
+        state_class=state_class,
+    )
+    for key, register, device_class, unit, scale, icon, state_class in SYSTEMAIR_SENSORS
+)
 
-    @property
-    def native_value(self):
-        return self._state
-
-    async def async_update(self):
-        try:
-            # 1. Fan Mode Logic
-            if self._register == 1160:
-                res_mode = await self._hub.async_pb_call(self._slave, 1160, 1, CALL_TYPE_REGISTER_INPUT)
-                if res_mode and hasattr(res_mode, 'registers'):
-                    mode_val = res_mode.registers[0]
-                    res_cmd = await self._hub.async_pb_call(self._slave, 1130, 1, CALL_TYPE_REGISTER_HOLDING)
-                    cmd_val = res_cmd.registers[0] if res_cmd and hasattr(res_cmd, 'registers') else None
-                    
-                    if mode_val == 0:
-                        self._state = {2: "auto_low", 3: "auto_normal", 4: "auto_high"}.get(cmd_val, "auto")
-                    elif mode_val == 1:
-                        self._state = {0: "manual_stop", 2: "manual_low", 3: "manual_normal", 4: "manual_high"}.get(cmd_val, "manual")
-                    else:
-                        self._state = {2: "crowded", 3: "refresh", 4: "fireplace", 5: "away", 6: "holiday", 7: "cooker_hood"}.get(mode_val, "unknown")
-                return
-
-            # 2. Summer/Winter Logic
-            if self._register == 1038:
-                result = await self._hub.async_pb_call(self._slave, 1038, 1, CALL_TYPE_REGISTER_HOLDING)
-                if result and hasattr(result, 'registers'):
-                    self._state = "summer" if result.registers[0] == 0 else "winter"
-                return
-
-            # 3. Filter Time
-            if self._register == 7005:
-                result = await self._hub.async_pb_call(self._slave, 7004, 2, CALL_TYPE_REGISTER_HOLDING)
-                if result and hasattr(result, 'registers'):
-                    total_seconds = (result.registers[1] << 16) + result.registers[0]
-                    self._state = round(total_seconds / 86400, 1)
-                return
-
-            # 4. Mode Time Remaining (Dynamic Formatting)
-            if self._register == 1111:
-                res_l = await self._hub.async_pb_call(self._slave, 1110, 1, CALL_TYPE_REGISTER_INPUT)
-                res_h = await self._hub.async_pb_call(self._slave, 1111, 1, CALL_TYPE_REGISTER_INPUT)
-                
-                if res_l and res_h and hasattr(res_l, 'registers'):
-                    total_sec = (res_h.registers[0] << 16) + res_l.registers[0]
-                    
-                    if total_sec <= 0:
-                        self._state = "Inaktiv" # Or "Av"
-                    elif total_sec < 3600:
-                        # Less than an hour: show minutes
-                        self._state = f"{total_sec // 60} min."
-                    elif total_sec < 86400:
-                        # Less than a day: show hours and remaining minutes
-                        h = total_sec // 3600
-                        m = (total_sec % 3600) // 60
-                        self._state = f"{h}t {m}m"
-                    else:
-                        # More than a day: show days and hours
-                        d = total_sec // 86400
-                        h = (total_sec % 86400) // 3600
-                        self._state = f"{d} dager {h}t"
+async def async_setup_entry(hass, entry, async_add_entities):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    entities = [SystemairSensor(coordinator, d) for d in SENSOR_DESCRIPTIONS]
+    entities.append(SystemairPollSensor(coordinator))
+    async_add_entities(entities)
+
+class SystemairSensor(SystemairEntity, SensorEntity):
+    entity_description: SystemairSensorEntityDescription
+
+    def __init__(self, coordinator, description):
+        super().__init__(coordinator, description)
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slave}_sensor_{description.register}_{description.key}"
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        if self.entity_description.register in COUNTDOWNS:
+            self.async_on_remove(async_track_time_interval(self.hass, self._async_tick, COUNTDOWN_TICK))
+
+    @callback
+    def _async_tick(self, now):
+        """Move the countdown on between reads."""
+        self._update_from_snapshot()
+        self.async_write_ha_state()
+
+    def _countdown(self, value):
+        """Counter value extrapolated from the last read to now."""
+        if value is None:
+            return None
+        age = self.coordinator.read_age(self.entity_description.register)
+        return value if age is None else max(0, value - int(age))
+
+    def _update_from_snapshot(self):
+        regs = self.coordinator.registers
+        register = self.entity_description.register
+
+        # 1. Fan Mode Logic
+        if register == 1160:
+            if (detail := self.coordinator.state.mode_detail) is not None:
+                self._attr_native_value = detail
+            return
+
+        # 2. Summer/Winter Logic
+        if register == 1038:
+            if (val := regs.get(1038)) is not None:
+                self._attr_native_value = "summer" if val == 0 else "winter"
+            return
+
+        # 3. Filter Time
+        if register == 7005:
+            low, high = regs.get(7004), regs.get(7005)
+            if low is not None and high is not None:
+                total_seconds = self._countdown((high << 16) + low)
+                self._attr_native_value = round(total_seconds / 86400, 1)
+            return
+
+        # 4. Mode Time Remaining (Dynamic Formatting)
+        if register == 1111:
+            total_sec = self._countdown(self.coordinator.state.time_remaining)
+            if total_sec is not None:
+                if total_sec <= 0:
+                    self._attr_native_value = "Inaktiv" # Or "Av"
+                elif total_sec < 3600:
+                    # Less than an hour: show minutes
+                    self._attr_native_value = f"{total_sec // 60} min."
+                elif total_sec < 86400:
+                    # Less than a day: show hours and remaining minutes
+                    h = total_sec // 3600
+                    m = (total_sec % 3600) // 60
+                    self._attr_native_value = f"{h}t {m}m"
                 else:
-                    self._state = None
-                return
-
-            # 5. Standard Logic
-            is_input = (12000 <= self._register <= 16000)
-            call_type = CALL_TYPE_REGISTER_INPUT if is_input else CALL_TYPE_REGISTER_HOLDING
-            result = await self._hub.async_pb_call(self._slave, self._register, 1, call_type)
-            
-            if result and hasattr(result, 'registers'):
-                val = float(result.registers[0])
-                # Handle signed 16-bit for specific registers
-                if is_input and self._register not in [12400, 12401, 12135, 14000, 14001, 14102]:
-                    if val > 32767: val -= 65536
-                self._state = round(val * self._scale, 1)
-
-        except Exception as e:
-            _LOGGER.error("Systemair: Update failed for %s: %s", self._attr_translation_key, e)
\ No newline at end of file
+                    # More than a day: show days and hours
+                    d = total_sec // 86400
+                    h = (total_sec % 86400) // 3600
+                    self._attr_native_value = f"{d} dager {h}t"
+            else:
+                self._attr_native_value = None
+            return
+
+        # 5. Standard Logic
+        val = regs.get(register)
+        if val is not None:
+            is_input = (12000 <= register <= 16000)
+            # Handle signed 16-bit for specific registers
+            if is_input and register not in UNSIGNED_INPUTS:
+                val = signed(val)
+            self._attr_native_value = round(float(val) * self.entity_description.scale, 1)
+
+class SystemairPollSensor(SystemairEntity, SensorEntity):
+    """Poll health: number of entities holding overdue values, with the details as attributes."""
+
+    _attr_translation_key = "stale_entities"
+    _attr_icon = "mdi:timer-alert-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    # Change every poll; not worth a recorder row each time
+    _unrecorded_attributes = frozenset({"overdue", "last_poll"})
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slave}_stale_entities"
+
+    def _update_from_snapshot(self):
+        overdue = self.coordinator.overdue()
+        self._attr_native_value = len(overdue)
+        self._attr_extra_state_attributes = {
+            "overdue": overdue,
+            "carried_over": self.coordinator.carried_over,
+            "last_poll": round(self.coordinator.last_poll, 2),
+        }
@@ -0,0 +1,280 @@
+"""Domain services acting on many units at once."""
+import asyncio
+import logging
+
+import voluptuous as vol
+from homeassistant.const import ATTR_DEVICE_ID, ATTR_TEMPERATURE
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+from homeassistant.components.modbus.const import (
+    CALL_TYPE_REGISTER_HOLDING,
+    CALL_TYPE_REGISTER_INPUT,
+)
+from .capture import BurstCapture
+from .const import DOMAIN, TRANSPORT_RTU
+from .coordinator import SystemairCoordinator, MODE_SPEED_DELAY, REG_USER_MODE_CMD
+from .profiler import NULL_PROFILER, ProfileSession
+from .state import REG_USER_MODE, REG_FAN_LEVEL, USER_MODES
+from .transport import SystemairModbusClient
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_SET_MODE = "set_mode"
+SERVICE_SET_SETPOINT = "set_setpoint"
+SERVICE_PROFILE = "profile"
+SERVICE_CAPTURE = "capture"
+
+ATTR_HUB = "hub"
+ATTR_MODE = "mode"
+ATTR_BROADCAST = "broadcast"
+ATTR_FORCE = "force"
+ATTR_DURATION = "duration"
+ATTR_SAMPLING = "sampling"
+ATTR_RATE = "rate"
+
+# hass.data[DOMAIN] key of the running profiling session
+DATA_PROFILE = "profile"
+# hass.data[DOMAIN] key of the running captures (entry_id -> task)
+DATA_CAPTURES = "captures"
+
+REG_SETPOINT = 2000
+
+TARGET_SCHEMA = {
+    vol.Optional(ATTR_DEVICE_ID, default=[]): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_HUB): cv.string,
+    vol.Optional(ATTR_BROADCAST, default=False): cv.boolean,
+    vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+}
+
+SET_MODE_SCHEMA = vol.Schema({
+    **TARGET_SCHEMA,
+    vol.Required(ATTR_MODE): vol.In(list(USER_MODES)),
+})
+
+SET_SETPOINT_SCHEMA = vol.Schema({
+    **TARGET_SCHEMA,
+    vol.Required(ATTR_TEMPERATURE): vol.All(vol.Coerce(float), vol.Range(min=12, max=30)),
+})
+
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DEVICE_ID, default=[]): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_HUB): cv.string,
+    vol.Optional(ATTR_DURATION, default=60): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+    vol.Optional(ATTR_SAMPLING, default=True): cv.boolean,
+})
+
+CAPTURE_SCHEMA = vol.Schema({
+    vol.Required(ATTR_DEVICE_ID): cv.string,
+    vol.Optional(ATTR_DURATION, default=180): vol.All(vol.Coerce(int), vol.Range(min=10, max=900)),
+    vol.Optional(ATTR_RATE, default=1): vol.All(vol.Coerce(float), vol.Range(min=0.2, max=5)),
+})
+
+
+def _coordinators(hass):
+    return [c for c in hass.data.get(DOMAIN, {}).values() if isinstance(c, SystemairCoordinator)]
+
+
+def _resolve_units(hass, call):
+    """The coordinators of the units a call targets: its devices plus every unit on `hub`."""
+    entry_ids = set()
+    registry = dr.async_get(hass)
+    for device_id in call.data[ATTR_DEVICE_ID]:
+        if (device := registry.async_get(device_id)) is not None:
+            entry_ids.update(device.config_entries)
+
+    hub = call.data.get(ATTR_HUB)
+    units = [c for c in _coordinators(hass) if c.entry_id in entry_ids or (hub and c.line == hub)]
+    if not units:
+        raise HomeAssistantError("No Systemair units match the given devices or hub")
+    return units
+
+
+def _split_broadcast(hass, units, broadcast):
+    """Group the units into (broadcast lines, units written one by one).
+
+    Broadcast reaches every device on the wire, so a line only qualifies when it
+    is a direct RTU line and every unit set up on it is targeted.
+    """
+    if not broadcast:
+        return {}, units
+    by_line = {}
+    for unit in units:
+        by_line.setdefault(unit.line, []).append(unit)
+    lines, single = {}, []
+    for line, targeted in by_line.items():
+        on_line = [c for c in _coordinators(hass) if c.line == line]
+        if targeted[0].transport == TRANSPORT_RTU and len(on_line) == len(targeted):
+            lines[line] = targeted
+        else:
+            single.extend(targeted)
+    return lines, single
+
+
+async def _async_broadcast_mode(client, mode_val, speed_val):
+    await client.async_broadcast(REG_USER_MODE_CMD, mode_val)
+    if speed_val is not None:
+        await asyncio.sleep(MODE_SPEED_DELAY)
+        await client.async_broadcast(REG_FAN_LEVEL, speed_val)
+
+
+async def _async_dispatch(hass, call, unicast, broadcast, read_back, check):
+    """Send to every unit concurrently, then verify them with one read-back each."""
+    lines, single = _split_broadcast(hass, _resolve_units(hass, call), call.data[ATTR_BROADCAST])
+    await asyncio.gather(
+        *(broadcast(units[0].hub) for units in lines.values()),
+        *(unicast(unit) for unit in single),
+    )
+    units = [u for targeted in lines.values() for u in targeted] + single
+    read = await asyncio.gather(*(unit.async_read_back(read_back) for unit in units))
+
+    results = []
+    for unit, ok in zip(units, read):
+        verified = ok and check(unit.registers)
+        if not verified:
+            _LOGGER.warning("Systemair %s: %s not confirmed by the unit", unit.slave, call.service)
+        results.append({
+            "entry_id": unit.entry_id,
+            "slave": unit.slave,
+            "broadcast": unit.line in lines,
+            "verified": verified,
+        })
+    return {"units": results}
+
+
+async def _async_set_mode(hass, call):
+    mode_val, speed_val = USER_MODES[call.data[ATTR_MODE]]
+    force = call.data[ATTR_FORCE]
+
+    async def unicast(unit):
+        await unit.async_set_user_mode(mode_val, speed_val, force=force)
+
+    def check(regs):
+        return regs.get(REG_USER_MODE) == mode_val - 1 and (
+            speed_val is None or regs.get(REG_FAN_LEVEL) == speed_val
+        )
+
+    read_back = [(CALL_TYPE_REGISTER_INPUT, REG_USER_MODE)]
+    if speed_val is not None:
+        read_back.append((CALL_TYPE_REGISTER_HOLDING, REG_FAN_LEVEL))
+    return await _async_dispatch(
+        hass, call, unicast, lambda client: _async_broadcast_mode(client, mode_val, speed_val), read_back, check
+    )
+
+
+async def _async_set_setpoint(hass, call):
+    value = int(call.data[ATTR_TEMPERATURE] * 10)
+    force = call.data[ATTR_FORCE]
+
+    async def unicast(unit):
+        await unit.async_write_register(REG_SETPOINT, value, force=force)
+
+    return await _async_dispatch(
+        hass, call, unicast,
+        lambda client: client.async_broadcast(REG_SETPOINT, value),
+        [(CALL_TYPE_REGISTER_HOLDING, REG_SETPOINT)],
+        lambda regs: regs.get(REG_SETPOINT) == value,
+    )
+
+
+async def _async_profile(hass, call):
+    """Profile the targeted units (all by default) for a while, then write the result to a file."""
+    if hass.data[DOMAIN].get(DATA_PROFILE) is not None:
+        raise HomeAssistantError("A Systemair profiling session is already running")
+    if call.data[ATTR_DEVICE_ID] or call.data.get(ATTR_HUB):
+        units = _resolve_units(hass, call)
+    else:
+        units = _coordinators(hass)
+    if not units:
+        raise HomeAssistantError("No Systemair units are set up")
+
+    session = hass.data[DOMAIN][DATA_PROFILE] = ProfileSession(call.data[ATTR_SAMPLING])
+    clients = list({id(u.hub): u.hub for u in units if isinstance(u.hub, SystemairModbusClient)}.values())
+    for target in (*units, *clients):
+        target.profiler = session
+    path = hass.config.path(f"systemair_profile_{dt_util.now():%Y%m%d_%H%M%S}.json")
+
+    async def _async_finish(_now):
+        for target in (*units, *clients):
+            target.profiler = NULL_PROFILER
+        # Joins the sampler thread
+        await hass.async_add_executor_job(session.stop)
+        top = session.top_stacks(10)
+        for unit in units:
+            unit.last_profile = {
+                "file": path,
+                "duration_s": round(session.duration, 1),
+                "spans": session.summary(unit.label),
+                "connection": session.summary(unit.hub.name) if unit.hub in clients else None,
+                "top_stacks": top,
+            }
+        try:
+            await hass.async_add_executor_job(session.write, path)
+        finally:
+            hass.data[DOMAIN].pop(DATA_PROFILE, None)
+        _LOGGER.info("Systemair: Profile of %d unit(s) written to %s", len(units), path)
+
+    async_call_later(hass, call.data[ATTR_DURATION], _async_finish)
+    return {"file": path, "units": [unit.label for unit in units]}
+
+
+async def _async_capture(hass, call):
+    """Start a burst capture of one unit; returns the file it goes to."""
+    device = dr.async_get(hass).async_get(call.data[ATTR_DEVICE_ID])
+    units = [c for c in _coordinators(hass) if device and c.entry_id in device.config_entries]
+    if not units:
+        raise HomeAssistantError("The device is not a Systemair unit")
+    unit = units[0]
+    captures = hass.data[DOMAIN].setdefault(DATA_CAPTURES, {})
+    if unit.entry_id in captures:
+        raise HomeAssistantError(f"A capture of Systemair unit {unit.slave} is already running")
+
+    path = hass.config.path(f"systemair_capture_{unit.slave}_{dt_util.now():%Y%m%d_%H%M%S}.csv")
+    capture = BurstCapture(hass, unit, path)
+
+    async def _async_run():
+        try:
+            await capture.async_run(call.data[ATTR_RATE], call.data[ATTR_DURATION])
+        finally:
+            captures.pop(unit.entry_id, None)
+
+    captures[unit.entry_id] = hass.async_create_background_task(_async_run(), f"{DOMAIN}_capture_{unit.slave}")
+    return {"file": path}
+
+
+async def async_cancel_capture(hass, entry_id):
+    """Stop a running capture of a unit (when it is unloaded)."""
+    if (task := hass.data[DOMAIN].get(DATA_CAPTURES, {}).get(entry_id)) is not None:
+        task.cancel()
+
+
+def async_setup_services(hass):
+    """Register the fleet services (once, for all units)."""
+
+    async def set_mode(call):
+        return await _async_set_mode(hass, call)
+
+    async def set_setpoint(call):
+        return await _async_set_setpoint(hass, call)
+
+    async def profile(call):
+        return await _async_profile(hass, call)
+
+    async def capture(call):
+        return await _async_capture(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_MODE, set_mode, schema=SET_MODE_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_SETPOINT, set_setpoint, schema=SET_SETPOINT_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, profile, schema=PROFILE_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_CAPTURE, capture, schema=CAPTURE_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
@@ -0,0 +1,86 @@
+"""Operating state of a unit, decoded once per update from the register snapshot."""
+from typing import NamedTuple
+
+from homeassistant.components.climate.const import HVACAction, HVACMode
+from homeassistant.components.modbus.const import (
+    CALL_TYPE_REGISTER_HOLDING,
+    CALL_TYPE_REGISTER_INPUT,
+)
+
+REG_USER_MODE = 1160        # input, reads back (written value - 1)
+REG_FAN_LEVEL = 1130        # holding
+REG_TIME_REM_LOW = 1110     # input, seconds left of a timed mode
+REG_TIME_REM_HIGH = 1111
+REG_HEATER = 2148           # holding, heater output in %
+
+# What the mode and HVAC part of the state is decoded from, for entities rendering it.
+# The time remaining is tracked by its countdown sensor, which reads it on the slow tier.
+STATE_REGISTERS = (
+    (CALL_TYPE_REGISTER_INPUT, (REG_USER_MODE,)),
+    (CALL_TYPE_REGISTER_HOLDING, (REG_FAN_LEVEL, REG_HEATER)),
+)
+
+# Selectable modes: option -> (value for 1161, fan level for 1130 or None)
+# Register 1161: 1=Auto, 2=Manual, 3=Crowded, 4=Refresh, 5=Fireplace, 6=Away, 7=Holiday
+USER_MODES = {
+    "auto": (1, None),          # Skriver 1 -> Leser 0
+    "manual_low": (2, 2),       # Skriver 2 -> Leser 1
+    "manual_normal": (2, 3),    # Skriver 2 -> Leser 1
+    "manual_high": (2, 4),      # Skriver 2 -> Leser 1
+    "crowded": (3, None),       # Skriver 3 -> Leser 2
+    "refresh": (4, None),       # Skriver 4 -> Leser 3
+    "fireplace": (5, None),     # Skriver 5 -> Leser 4
+    "away": (6, None),          # Skriver 6 -> Leser 5
+    "holiday": (7, None),       # Skriver 7 -> Leser 6
+}
+
+# 1160 -> mode name, for the modes that do not depend on the fan level
+_TIMED_MODES = {2: "crowded", 3: "refresh", 4: "fireplace", 5: "away", 6: "holiday", 7: "cooker_hood"}
+_MANUAL_LEVELS = {2: "manual_low", 3: "manual_normal", 4: "manual_high"}
+_AUTO_DETAIL = {2: "auto_low", 3: "auto_normal", 4: "auto_high"}
+_MANUAL_DETAIL = {0: "manual_stop", **_MANUAL_LEVELS}
+# Fan level assumed until 1130 has been read
+_DEFAULT_FAN_LEVEL = 3
+
+
+class OperatingState(NamedTuple):
+    """What the unit is doing, as the entities present it. None = not read yet."""
+    user_mode: int | None = None      # raw 1160
+    fan_level: int | None = None      # raw 1130
+    mode: str | None = None           # key of USER_MODES, None for modes that cannot be selected
+    mode_detail: str | None = None    # mode incl. the fan level, e.g. "auto_low"
+    time_remaining: int | None = None # s, as of the last read of 1110/1111
+    heater: int | None = None         # %
+    hvac_mode: HVACMode = HVACMode.FAN_ONLY
+    hvac_action: HVACAction = HVACAction.IDLE
+
+
+def decode_state(regs) -> OperatingState:
+    """Build the operating state from a register snapshot (address -> raw value)."""
+    user_mode = regs.get(REG_USER_MODE)
+    fan_level = regs.get(REG_FAN_LEVEL)
+    level = _DEFAULT_FAN_LEVEL if fan_level is None else fan_level
+
+    mode = detail = None
+    if user_mode == 0:
+        mode = "auto"
+        detail = _AUTO_DETAIL.get(fan_level, "auto")
+    elif user_mode == 1:
+        mode = _MANUAL_LEVELS.get(level, "manual_normal")
+        detail = _MANUAL_DETAIL.get(fan_level, "manual")
+    elif user_mode is not None:
+        detail = _TIMED_MODES.get(user_mode, "unknown")
+        mode = detail if detail in USER_MODES else None
+
+    low, high = regs.get(REG_TIME_REM_LOW), regs.get(REG_TIME_REM_HIGH)
+    time_remaining = None if low is None or high is None else (high << 16) + low
+
+    heater = regs.get(REG_HEATER)
+    if heater:
+        hvac_mode, hvac_action = HVACMode.HEAT, HVACAction.HEATING
+    elif level <= 1:
+        hvac_mode, hvac_action = HVACMode.OFF, HVACAction.OFF
+    else:
+        hvac_mode, hvac_action = HVACMode.FAN_ONLY, HVACAction.IDLE
+
+    return OperatingState(user_mode, fan_level, mode, detail, time_remaining, heater, hvac_mode, hvac_action)
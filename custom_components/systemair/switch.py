@@ -1,12 +1,10 @@
 import logging
-from homeassistant.components.switch import SwitchEntity
+from dataclasses import dataclass
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.const import CONF_MODEL, CONF_NAME
-from homeassistant.components.modbus.const import (
-    CALL_TYPE_WRITE_REGISTER, 
-    CALL_TYPE_REGISTER_HOLDING
-)
-from .const import DOMAIN, CONF_SLAVE
+from homeassistant.components.modbus.const import CALL_TYPE_REGISTER_HOLDING
+from .const import DOMAIN, SCHEDULE_KEYS
+from .entity import SystemairEntity, SystemairEntityDescription, apply_profile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,69 +31,47 @@ SYSTEMAIR_SWITCHES = [
     ("sun_p2", 5113, "mdi:calendar-check", EntityCategory.CONFIG),  
 ]
 
-async def async_setup_entry(hass, entry, async_add_entities):
-    """Set up Systemair switches."""
-    config = entry.data
-    hub_name = config.get("hub_name", "modbus_hub")
-    
-    from homeassistant.components.modbus import get_hub
-    hub = get_hub(hass, hub_name)
-    
-    if hub is None:
-        _LOGGER.error("Systemair: Modbus hub '%s' not found for switches", hub_name)
-        return
+@dataclass(frozen=True, kw_only=True)
+class SystemairSwitchEntityDescription(SystemairEntityDescription, SwitchEntityDescription):
+    register: int
 
-    model = config.get(CONF_MODEL, "SAVE")
-    slave = config.get(CONF_SLAVE, 1)
+SWITCH_DESCRIPTIONS = tuple(
+    SystemairSwitchEntityDescription(
+        key=key,
+        translation_key=key,
+        register=register,
+        registers=((CALL_TYPE_REGISTER_HOLDING, (register,)),),
+        icon=icon,
+        entity_category=category,
+        # The schedule calendar covers the weekly schedule toggles
+        entity_registry_enabled_default=key not in SCHEDULE_KEYS,
+    )
+    for key, register, icon, category in SYSTEMAIR_SWITCHES
+)
 
-    entities = [SaveSwitch(hub, model, slave, *s) for s in SYSTEMAIR_SWITCHES]
-    async_add_entities(entities, True)
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up Systemair switches."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
 
-class SaveSwitch(SwitchEntity):
-    
-    _attr_has_entity_name = True
+    entities = [SaveSwitch(coordinator, d) for d in apply_profile(entry, SWITCH_DESCRIPTIONS)]
+    async_add_entities(entities)
 
-    def __init__(self, hub, model, slave, name, register, icon, category):
-        self._hub = hub
-        self._slave = slave
-        self._model = model
-        self._register = register
-        
-        # Change self._attr_name to self._attr_translation_key
-        self._attr_translation_key = name  
-        self._attr_icon = icon
-        self._attr_entity_category = category
-        self._attr_unique_id = f"{DOMAIN}_{slave}_sw_{register}"
-        self._attr_is_on = None
+class SaveSwitch(SystemairEntity, SwitchEntity):
+    entity_description: SystemairSwitchEntityDescription
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, f"{self._model}_{self._slave}")},
-            "name": f"Systemair {self._model}",
-            "manufacturer": "Systemair",
-            "model": f"SAVE {self._model}",
-        }
+    def __init__(self, coordinator, description):
+        super().__init__(coordinator, description)
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slave}_sw_{description.register}"
 
     async def async_turn_on(self, **kwargs):
         """Write 1 to enable the feature."""
-        result = await self._hub.async_pb_call(self._slave, self._register, 1, CALL_TYPE_WRITE_REGISTER)
-        if result:
-            self._attr_is_on = True
-            self.async_write_ha_state()
+        await self.coordinator.async_write_register(self.entity_description.register, 1)
 
     async def async_turn_off(self, **kwargs):
         """Write 0 to disable the feature."""
-        result = await self._hub.async_pb_call(self._slave, self._register, 0, CALL_TYPE_WRITE_REGISTER)
-        if result:
-            self._attr_is_on = False
-            self.async_write_ha_state()
+        await self.coordinator.async_write_register(self.entity_description.register, 0)
 
-    async def async_update(self):
-        """Read current state from Modbus register."""
-        try:
-            result = await self._hub.async_pb_call(self._slave, self._register, 1, CALL_TYPE_REGISTER_HOLDING)
-            if result and hasattr(result, 'registers'):
-                self._attr_is_on = (result.registers[0] == 1)
-        except Exception as e:
-            _LOGGER.error("Systemair: Update failed for switch %s: %s", self._attr_translation_key, e)
\ No newline at end of file
+    def _update_from_snapshot(self):
+        """Read current state from the register snapshot."""
+        if (val := self.coordinator.registers.get(self.entity_description.register)) is not None:
+            self._attr_is_on = (val == 1)
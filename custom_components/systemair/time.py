@@ -1,14 +1,12 @@
 import asyncio
 import logging
 from datetime import time
-from homeassistant.components.time import TimeEntity
+from dataclasses import dataclass
+from homeassistant.components.time import TimeEntity, TimeEntityDescription
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.const import CONF_MODEL
-from homeassistant.components.modbus.const import (
-    CALL_TYPE_WRITE_REGISTER, 
-    CALL_TYPE_REGISTER_HOLDING
-)
-from .const import DOMAIN, CONF_SLAVE
+from homeassistant.components.modbus.const import CALL_TYPE_REGISTER_HOLDING
+from .const import DOMAIN, SCHEDULE_KEYS
+from .entity import SystemairEntity, SystemairEntityDescription, apply_profile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,77 +31,63 @@ TIME_SETTINGS = [
     ("sun_p2_start", 5054, 5055), ("sun_p2_end", 5056, 5057),
 ]
 
+@dataclass(frozen=True, kw_only=True)
+class SystemairTimeEntityDescription(SystemairEntityDescription, TimeEntityDescription):
+    hour_register: int
+    minute_register: int
+
+TIME_DESCRIPTIONS = tuple(
+    SystemairTimeEntityDescription(
+        key=key,
+        translation_key=key,
+        hour_register=hr_reg,
+        minute_register=min_reg,
+        registers=((CALL_TYPE_REGISTER_HOLDING, (hr_reg, min_reg)),),
+        entity_category=EntityCategory.CONFIG,
+        # The schedule calendar covers the weekly schedule times
+        entity_registry_enabled_default=key not in SCHEDULE_KEYS,
+    )
+    for key, hr_reg, min_reg in TIME_SETTINGS
+)
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up time entities."""
-    config = entry.data
-    hub_name = config.get("hub_name", "modbus_hub")
-    
-    from homeassistant.components.modbus import get_hub
-    hub = get_hub(hass, hub_name)
-    
-    if hub is None:
-        _LOGGER.error("Systemair: Modbus hub '%s' not found for time setup", hub_name)
-        return
-
-    model = config.get(CONF_MODEL, "SAVE")
-    slave = config.get(CONF_SLAVE, 1)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [SaveTime(hub, model, slave, *t) for t in TIME_SETTINGS]
-    async_add_entities(entities, True)
+    entities = [SaveTime(coordinator, d) for d in apply_profile(entry, TIME_DESCRIPTIONS)]
+    async_add_entities(entities)
 
-class SaveTime(TimeEntity):
+class SaveTime(SystemairEntity, TimeEntity):
     """Representation of Time setting (Hour/Minute registers)."""
-    
-    _attr_has_entity_name = True
+    entity_description: SystemairTimeEntityDescription
 
-    def __init__(self, hub, model, slave, translation_key, hr_reg, min_reg):
-        self._hub = hub
-        self._slave = slave
-        self._model = model
-        self._hr_reg = hr_reg
-        self._min_reg = min_reg
-        
-        # Changed from self._attr_name to self._attr_translation_key
-        self._attr_translation_key = translation_key
-        self._attr_unique_id = f"{DOMAIN}_{slave}_time_{hr_reg}"
-        self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_native_value = None
-
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, f"{self._model}_{self._slave}")},
-            "name": f"Systemair {self._model}",
-            "manufacturer": "Systemair",
-            "model": f"SAVE {self._model}",
-        }
+    def __init__(self, coordinator, description):
+        super().__init__(coordinator, description)
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slave}_time_{description.hour_register}"
 
     async def async_set_value(self, value: time) -> None:
         """Write hour and minute registers."""
+        desc = self.entity_description
         try:
-            await self._hub.async_pb_call(self._slave, self._hr_reg, value.hour, CALL_TYPE_WRITE_REGISTER)
-            await asyncio.sleep(0.3) 
-            await self._hub.async_pb_call(self._slave, self._min_reg, value.minute, CALL_TYPE_WRITE_REGISTER)
-            
-            self._attr_native_value = value
-            self.async_write_ha_state()
+            # Skip registers that already hold the value, and the pause with them
+            write_hr = not self.coordinator.is_current(desc.hour_register, value.hour)
+            if write_hr:
+                await self.coordinator.async_write_register(desc.hour_register, value.hour)
+            if not self.coordinator.is_current(desc.minute_register, value.minute):
+                if write_hr:
+                    await asyncio.sleep(0.3) 
+                await self.coordinator.async_write_register(desc.minute_register, value.minute)
         except Exception as e:
             # Updated to use translation_key for logging
-            _LOGGER.error("Systemair: Failed to set %s: %s", self._attr_translation_key, e)
-
-    async def async_update(self):
-        """Read time registers."""
-        try:
-            res_hr = await self._hub.async_pb_call(self._slave, self._hr_reg, 1, CALL_TYPE_REGISTER_HOLDING)
-            res_min = await self._hub.async_pb_call(self._slave, self._min_reg, 1, CALL_TYPE_REGISTER_HOLDING)
+            _LOGGER.error("Systemair: Failed to set %s: %s", desc.key, e)
 
-            if res_hr and res_min and hasattr(res_hr, 'registers') and hasattr(res_min, 'registers'):
-                h, m = res_hr.registers[0], res_min.registers[0]
-                if 0 <= h <= 23 and 0 <= m <= 59:
-                    self._attr_native_value = time(hour=h, minute=m)
-                else:
-                    self._attr_native_value = None
-        except Exception as e:
-            # Updated to use translation_key for logging
-            _LOGGER.error("Systemair: Time update failed for %s: %s", self._attr_translation_key, e)
-            self._attr_native_value = None
\ No newline at end of file
+    def _update_from_snapshot(self):
+        """Decode the time registers."""
+        h = self.coordinator.registers.get(self.entity_description.hour_register)
+        m = self.coordinator.registers.get(self.entity_description.minute_register)
+        if h is None or m is None:
+            return
+        if 0 <= h <= 23 and 0 <= m <= 59:
+            self._attr_native_value = time(hour=h, minute=m)
+        else:
+            self._attr_native_value = None
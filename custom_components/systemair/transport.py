@@ -0,0 +1,281 @@
+"""Direct async Modbus transport owned by the Systemair integration.
+
+The default path goes through the modbus integration hub from configuration.yaml.
+This module is the alternative: a persistent pymodbus client (TCP or RTU) with
+its own pacing and reconnect backoff. It exposes the same ``async_pb_call``
+signature as the HA hub, so the platforms do not care which one they talk to.
+"""
+import asyncio
+import inspect
+import logging
+import time
+
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+from pymodbus.exceptions import ConnectionException, ModbusException
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TIMEOUT
+from homeassistant.components.modbus.const import (
+    CALL_TYPE_REGISTER_HOLDING,
+    CALL_TYPE_REGISTER_INPUT,
+    CALL_TYPE_WRITE_REGISTER,
+    CALL_TYPE_WRITE_REGISTERS,
+)
+from .const import (
+    DOMAIN,
+    CONF_TRANSPORT,
+    TRANSPORT_TCP,
+    CONF_CONNECTIONS,
+    CONF_FRAME_DELAY,
+    CONF_RECONNECT_DELAY,
+    CONF_RECONNECT_DELAY_MAX,
+    CONF_BAUDRATE,
+    CONF_BYTESIZE,
+    CONF_PARITY,
+    CONF_STOPBITS,
+    DEFAULT_TCP_PORT,
+    DEFAULT_CONNECTIONS,
+    DEFAULT_FRAME_DELAY,
+    DEFAULT_TIMEOUT,
+    DEFAULT_RECONNECT_DELAY,
+    DEFAULT_RECONNECT_DELAY_MAX,
+    DEFAULT_BAUDRATE,
+    DEFAULT_BYTESIZE,
+    DEFAULT_PARITY,
+    DEFAULT_STOPBITS,
+    ILLEGAL_DATA_ADDRESS,
+)
+from .planner import CostModel
+from .profiler import NULL_PROFILER
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data[DOMAIN] key for the shared client pool
+DATA_TRANSPORTS = "transports"
+
+# call type -> (pymodbus method, is_read)
+_CALLS = {
+    CALL_TYPE_REGISTER_HOLDING: ("read_holding_registers", True),
+    CALL_TYPE_REGISTER_INPUT: ("read_input_registers", True),
+    CALL_TYPE_WRITE_REGISTER: ("write_register", False),
+    CALL_TYPE_WRITE_REGISTERS: ("write_registers", False),
+}
+
+
+class _Connection:
+    """One persistent pymodbus client with inter-frame pacing and reconnect backoff."""
+
+    def __init__(self, client, frame_delay, reconnect_delay, reconnect_delay_max):
+        self._client = client
+        self._frame_delay = frame_delay / 1000
+        self._reconnect_delay = reconnect_delay
+        self._reconnect_delay_max = reconnect_delay_max
+        self._failures = 0
+        self._retry_at = 0.0
+        self._last_frame = 0.0
+        # pymodbus renamed slave= to device_id= in 3.10
+        params = inspect.signature(client.read_holding_registers).parameters
+        self._device_kw = "device_id" if "device_id" in params else "slave"
+
+    async def async_ensure_connected(self) -> bool:
+        if self._client.connected:
+            return True
+        if time.monotonic() < self._retry_at:
+            return False
+        try:
+            connected = await self._client.connect()
+        except (ModbusException, OSError) as err:
+            _LOGGER.debug("Systemair: Connect failed: %s", err)
+            connected = False
+        if connected:
+            if self._failures:
+                _LOGGER.info("Systemair: Modbus connection restored")
+            self._failures = 0
+            return True
+        self._failures += 1
+        delay = min(self._reconnect_delay_max, self._reconnect_delay * 2 ** (self._failures - 1))
+        self._retry_at = time.monotonic() + delay
+        if self._failures == 1:
+            _LOGGER.warning("Systemair: Modbus connection failed, retrying with backoff (max %ss)", self._reconnect_delay_max)
+        return False
+
+    async def call(self, slave, address, value, use_call):
+        if not await self.async_ensure_connected():
+            return None
+
+        # Keep the configured quiet time between frames on this connection
+        wait = self._last_frame + self._frame_delay - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        func_name, is_read = _CALLS[use_call]
+        func = getattr(self._client, func_name)
+        kwargs = {self._device_kw: slave}
+        try:
+            if is_read:
+                result = await func(address, count=value, **kwargs)
+            elif use_call == CALL_TYPE_WRITE_REGISTERS:
+                result = await func(address, value if isinstance(value, list) else [value], **kwargs)
+            else:
+                result = await func(address, value, **kwargs)
+        except (ConnectionException, OSError) as err:
+            _LOGGER.debug("Systemair: %s %s@%s failed: %s", use_call, address, slave, err)
+            # The line itself broke: drop the socket, the next call reconnects through the backoff
+            self._client.close()
+            return None
+        except ModbusException as err:
+            # One slave not answering (timeout, garbled reply) says nothing about the
+            # connection, which the other units on the line keep using
+            _LOGGER.debug("Systemair: %s %s@%s failed: %s", use_call, address, slave, err)
+            return None
+        finally:
+            self._last_frame = time.monotonic()
+
+        if result is None or result.isError():
+            _LOGGER.debug("Systemair: %s %s@%s returned %s", use_call, address, slave, result)
+            # Hand read rejections through so the coordinator can route around them
+            if is_read and getattr(result, "exception_code", None) == ILLEGAL_DATA_ADDRESS:
+                return result
+            return None
+        return result
+
+    async def broadcast(self, address, value) -> bool:
+        """Write one register on every unit on the line (slave 0). Nobody answers a broadcast."""
+        if not await self.async_ensure_connected():
+            return False
+        wait = self._last_frame + self._frame_delay - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            await self._client.write_register(address, value, **{self._device_kw: 0})
+        except ModbusException as err:
+            # Some pymodbus versions wait for an answer that never comes
+            _LOGGER.debug("Systemair: Broadcast of %s to %s: %s", value, address, err)
+        finally:
+            self._last_frame = time.monotonic()
+        return True
+
+    def close(self):
+        self._client.close()
+
+
+class SystemairModbusClient:
+    """Pool of persistent connections with the HA hub's call signature.
+
+    TCP gateways usually accept several sockets; with more than one connection
+    requests are pipelined across them. RTU always has exactly one.
+    """
+
+    def __init__(self, name, connections):
+        self.name = name
+        # Swapped for a ProfileSession while the profile service runs
+        self.profiler = NULL_PROFILER
+        # Learned from the reads on this line, queueing left out; the coordinators plan with it
+        self.cost_model = CostModel()
+        self._connections = connections
+        self._idle = asyncio.Queue()
+        for conn in connections:
+            self._idle.put_nowait(conn)
+
+    async def async_connect(self) -> bool:
+        """Open every connection now instead of on the first request."""
+        results = [await conn.async_ensure_connected() for conn in self._connections]
+        return all(results)
+
+    async def async_pb_call(self, slave, address, value, use_call):
+        """Execute one Modbus request, returning the response or None on failure.
+
+        Unlike the HA hub, a read the unit rejects as an illegal address returns
+        the exception response, which has no `registers`.
+        """
+        with self.profiler.span("queue", self.name):
+            conn = await self._idle.get()
+        try:
+            with self.profiler.span("transport", self.name):
+                started = time.monotonic()
+                result = await conn.call(slave, address, value, use_call)
+            if _CALLS[use_call][1] and hasattr(result, "registers"):
+                self.cost_model.add(value, time.monotonic() - started)
+            return result
+        finally:
+            self._idle.put_nowait(conn)
+
+    async def async_broadcast(self, address, value) -> bool:
+        """Write one register on every unit on the line (Modbus broadcast, no answers)."""
+        conn = await self._idle.get()
+        try:
+            return await conn.broadcast(address, value)
+        finally:
+            self._idle.put_nowait(conn)
+
+    async def async_close(self):
+        for conn in self._connections:
+            conn.close()
+
+
+def pool_key(config):
+    """Identifies the line (TCP gateway or serial port) a direct connection uses."""
+    if config[CONF_TRANSPORT] == TRANSPORT_TCP:
+        return f"tcp://{config[CONF_HOST]}:{config.get(CONF_PORT, DEFAULT_TCP_PORT)}"
+    return f"rtu://{config[CONF_PORT]}"
+
+
+def create_client(config) -> SystemairModbusClient:
+    """Build a client from config entry data (not connected yet)."""
+    timeout = config.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+    if config[CONF_TRANSPORT] == TRANSPORT_TCP:
+        count = config.get(CONF_CONNECTIONS, DEFAULT_CONNECTIONS)
+        clients = [
+            AsyncModbusTcpClient(
+                config[CONF_HOST],
+                port=config.get(CONF_PORT, DEFAULT_TCP_PORT),
+                timeout=timeout,
+                retries=0,
+                reconnect_delay=0,  # we do our own backoff
+            )
+            for _ in range(count)
+        ]
+    else:
+        clients = [
+            AsyncModbusSerialClient(
+                config[CONF_PORT],
+                baudrate=config.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
+                bytesize=config.get(CONF_BYTESIZE, DEFAULT_BYTESIZE),
+                parity=config.get(CONF_PARITY, DEFAULT_PARITY),
+                stopbits=config.get(CONF_STOPBITS, DEFAULT_STOPBITS),
+                timeout=timeout,
+                retries=0,
+                reconnect_delay=0,
+            )
+        ]
+
+    connections = [
+        _Connection(
+            c,
+            config.get(CONF_FRAME_DELAY, DEFAULT_FRAME_DELAY),
+            config.get(CONF_RECONNECT_DELAY, DEFAULT_RECONNECT_DELAY),
+            config.get(CONF_RECONNECT_DELAY_MAX, DEFAULT_RECONNECT_DELAY_MAX),
+        )
+        for c in clients
+    ]
+    return SystemairModbusClient(pool_key(config), connections)
+
+
+async def async_acquire_client(hass, config) -> SystemairModbusClient:
+    """Get the shared client for this line, creating it for the first unit on it."""
+    pool = hass.data[DOMAIN].setdefault(DATA_TRANSPORTS, {})
+    key = pool_key(config)
+    if key not in pool:
+        pool[key] = [create_client(config), 0]
+    pool[key][1] += 1
+    return pool[key][0]
+
+
+async def async_release_client(hass, config):
+    """Drop one reference to the shared client, closing it with the last unit."""
+    pool = hass.data[DOMAIN].get(DATA_TRANSPORTS, {})
+    key = pool_key(config)
+    if key not in pool:
+        return
+    pool[key][1] -= 1
+    if pool[key][1] <= 0:
+        client, _ = pool.pop(key)
+        await client.async_close()
@@ -0,0 +1,5 @@
+"""Make custom_components importable when the tests run from the repository root."""
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
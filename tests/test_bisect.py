@@ -0,0 +1,76 @@
+"""Tests for isolating unsupported registers by bisecting failed block reads."""
+import asyncio
+import math
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.components.modbus.const import CALL_TYPE_REGISTER_HOLDING  # noqa: E402
+
+from custom_components.systemair.const import UNSUPPORTED_STRIKES  # noqa: E402
+from custom_components.systemair.coordinator import READ_FAILED, SystemairCoordinator  # noqa: E402
+from custom_components.systemair.planner import Block  # noqa: E402
+from custom_components.systemair.profiler import NULL_PROFILER  # noqa: E402
+
+
+class _Hub:
+    """Answers every read like the HA hub: None for any failure, no exception code."""
+
+    def __init__(self, unsupported):
+        self.unsupported = unsupported
+        self.requests = 0
+
+    async def async_pb_call(self, slave, address, count, call_type):
+        self.requests += 1
+        if any(addr in self.unsupported for addr in range(address, address + count)):
+            return None
+        return SimpleNamespace(registers=[0] * count)
+
+
+def _coordinator(hub):
+    # Only the state the read and bisect paths use
+    coordinator = SystemairCoordinator.__new__(SystemairCoordinator)
+    coordinator.hub = hub
+    coordinator.slave = 1
+    coordinator.label = "test#1"
+    coordinator.profiler = NULL_PROFILER
+    coordinator._line_lock = None
+    coordinator.registers = {}
+    coordinator._read_at = {}
+    coordinator._unconfirmed = set()
+    coordinator._pending_writes = {}
+    coordinator._slow_due = 0.0
+    coordinator._strikes = {}
+    coordinator.unsupported = set()
+    coordinator._plan_dirty = False
+    coordinator._store = SimpleNamespace(async_delay_save=lambda *args: None)
+    return coordinator
+
+
+def test_adjacent_unsupported_registers_are_isolated_through_the_hub():
+    hub = _Hub(unsupported={1003, 1004})
+    coordinator = _coordinator(hub)
+    block = Block(CALL_TYPE_REGISTER_HOLDING, 1000, 5)
+
+    async def polls():
+        for _ in range(UNSUPPORTED_STRIKES):
+            await coordinator._async_bisect(block, READ_FAILED, math.inf)
+
+    asyncio.run(polls())
+    assert coordinator.unsupported == {
+        (CALL_TYPE_REGISTER_HOLDING, 1003),
+        (CALL_TYPE_REGISTER_HOLDING, 1004),
+    }
+    assert all(coordinator.registers.get(addr) == 0 for addr in (1000, 1001, 1002))
+
+
+def test_silent_unit_is_not_bisected_further():
+    hub = _Hub(unsupported=set(range(0, 20000)))
+    coordinator = _coordinator(hub)
+
+    asyncio.run(coordinator._async_bisect(Block(CALL_TYPE_REGISTER_HOLDING, 1000, 100), READ_FAILED, math.inf))
+    # Both halves and the probe of 1160
+    assert hub.requests == 3
+    assert not coordinator._strikes
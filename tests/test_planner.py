@@ -0,0 +1,41 @@
+"""Tests for the read planner's cost model and block planning."""
+import importlib.util
+import pathlib
+
+# planner.py has no Home Assistant imports; load it without the package __init__
+_PATH = pathlib.Path(__file__).parents[1] / "custom_components" / "systemair" / "planner.py"
+_SPEC = importlib.util.spec_from_file_location("systemair_planner", _PATH)
+planner = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(planner)
+
+
+def _learn(model, request_cost, register_cost, sizes, rounds=200):
+    for _ in range(rounds):
+        for count in sizes:
+            model.add(count, request_cost + count * register_cost)
+
+
+def test_cost_model_recovers_fast_line_from_small_blocks():
+    model = planner.CostModel()
+    _learn(model, 0.010, 0.0001, sizes=(1, 2, 4, 7, 15))
+    request_cost, register_cost = model.costs
+    assert abs(request_cost - 0.010) < 0.0005
+    assert abs(register_cost - 0.0001) < 0.00002
+
+
+def test_cost_model_recovers_slow_line_from_small_blocks():
+    model = planner.CostModel()
+    _learn(model, 0.020, 0.001, sizes=(1, 3, 5, 12))
+    request_cost, register_cost = model.costs
+    assert abs(request_cost - 0.020) < 0.001
+    assert abs(register_cost - 0.001) < 0.0001
+
+
+def test_optimal_blocks_reads_through_gaps_on_a_fast_line():
+    blocks = planner.optimal_blocks("holding", [1, 2, 40, 41], 0.010, 0.0001)
+    assert blocks == [planner.Block("holding", 1, 41)]
+
+
+def test_optimal_blocks_never_bridges_excluded_registers():
+    blocks = planner.optimal_blocks("holding", [1, 2, 40, 41], 0.010, 0.0001, exclude={20})
+    assert blocks == [planner.Block("holding", 1, 2), planner.Block("holding", 40, 2)]